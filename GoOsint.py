@@ -5,22 +5,41 @@ A comprehensive Gmail reconnaissance tool for OSINT investigations
 """
 
 import argparse
+import atexit
+import glob
+import gzip
+import hashlib
+import heapq
 import sys
 import os
+import re
 import json
+import shutil
 import subprocess
-from colorama import Fore, Back, Style, init
+import threading
+import textwrap
+import time
+from functools import lru_cache
+from array import array
+from collections import deque, namedtuple
 from datetime import datetime
+from importlib.util import find_spec
+# csv, sqlite3 and concurrent.futures (which loads logging) are imported by the
+# code that uses them, keeping them off the start-up path of --help and -e
 
-# Try to import GHunt's globals for rich console, fallback to basic implementation
-try:
-    from ghunt import globals as gb
-    GHUNT_AVAILABLE = True
-except ImportError:
-    GHUNT_AVAILABLE = False
+# GHunt takes a few hundred milliseconds to import, so it is only loaded when
+# an investigation needs it; this just checks that the package is installed
+GHUNT_AVAILABLE = find_spec("ghunt") is not None
 
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
+_rich_console = None
+
+def rich_console():
+    """Return the GHunt-style rich console, creating it on first use"""
+    global _rich_console
+    if _rich_console is None:
+        from rich.console import Console
+        _rich_console = Console(highlight=False)
+    return _rich_console
 
 class RGBColors:
     """Custom RGB color class using ANSI escape codes"""
@@ -51,22 +70,2357 @@ def show_banner():
     [blue]╚██████╔╝╚██████╔╝[/][blue]╚██████╔╝███████║██║██║ ╚████║   ██║   [/]
     [blue] ╚═════╝  ╚═════╝ [/][blue]╚═════╝ ╚══════╝╚═╝╚═╝  ╚═══╝   ╚═╝   [/]
 
-             [bold][blue]Gmail OSINT Tool powered by GHunt[/blue][/bold]
-             [cyan]Version 1.0 | Author: OSINT Researcher[/cyan]
-        [yellow]⚠️  For Educational and Legal OSINT purposes only ⚠️[/yellow]
+             [bold][blue]Gmail OSINT Tool powered by GHunt[/blue][/bold]
+             [cyan]Version 1.0 | Author: OSINT Researcher[/cyan]
+        [yellow]⚠️  For Educational and Legal OSINT purposes only ⚠️[/yellow]
+        """
+        try:
+            rich_console().print(banner)
+        except Exception:
+            # Fallback to basic print
+            print("GoOsint - Gmail OSINT Tool powered by GHunt")
+    else:
+        print("GoOsint - Gmail OSINT Tool powered by GHunt")
+
+def iter_stream_records(stream_path):
+    """Yield (session_info, investigation) pairs from a JSONL results stream.
+
+    Exactly one of the two is set for each record; header and trailer lines
+    carry session_info. A truncated last line (e.g. after a crash) is skipped.
+    """
+    with open(stream_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if "session_info" in record and "email" not in record:
+                yield record["session_info"], None
+            else:
+                yield None, record
+
+def convert_stream_to_json(stream_path, json_path=None):
+    """Write the pretty-printed session JSON file for a JSONL results stream.
+
+    The stream is read twice (once for the session info, once for the
+    investigations) so memory use doesn't depend on the number of results.
+    """
+    if json_path is None:
+        json_path = os.path.splitext(stream_path)[0] + ".json"
+    try:
+        session_info = {}
+        total = 0
+        for info, investigation in iter_stream_records(stream_path):
+            if info is not None:
+                session_info.update(info)
+            else:
+                total += 1
+        session_info["total_investigations"] = total
+
+        with open(json_path, 'w', encoding='utf-8') as f:
+            f.write('{\n  "session_info": ')
+            f.write(textwrap.indent(json.dumps(session_info, indent=2, ensure_ascii=False), '  ').lstrip())
+            f.write(',\n  "investigations": [')
+            first = True
+            for info, investigation in iter_stream_records(stream_path):
+                if investigation is None:
+                    continue
+                f.write('\n' if first else ',\n')
+                f.write(textwrap.indent(json.dumps(investigation, indent=2, ensure_ascii=False), '    '))
+                first = False
+            f.write('\n  ]\n}' if not first else ']\n}')
+
+        print(f"{RGBColors.GOOGLE_GREEN}✓ All results saved to: {os.path.relpath(json_path)}{RGBColors.reset()}")
+        return True
+    except Exception as e:
+        print(f"{RGBColors.GOOGLE_RED}✗ Error converting results stream: {str(e)}{RGBColors.reset()}")
+        return False
+
+# Domains where Google ignores dots and "+tag" suffixes in the local part
+GMAIL_DOMAINS = ("gmail.com", "googlemail.com")
+
+def normalize_email(email):
+    """Normalize an email address so different spellings share one key.
+
+    Addresses are lowercased; for Gmail the dots and any "+tag" suffix are
+    removed from the local part and googlemail.com becomes gmail.com, since
+    all of those spellings reach the same Google account.
+    """
+    email = email.strip().lower()
+    local, at, domain = email.rpartition("@")
+    if at and domain in GMAIL_DOMAINS:
+        local = local.split("+", 1)[0].replace(".", "")
+        return f"{local}@gmail.com"
+    return email
+
+def is_valid_email(email):
+    """Cheap sanity check for an address read from an input list"""
+    local, at, domain = email.rpartition("@")
+    return bool(at and local and "." in domain and not any(c.isspace() for c in email))
+
+def open_email_list(path):
+    """Open an email list for reading: a text file, a .gz file or "-" for stdin"""
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+def read_email_list(path, column=None):
+    """Yield candidate email addresses from a list, one at a time.
+
+    path may be a text file with one address per line, a CSV file (or any
+    file when column is given), a .gz compressed version of either, or "-"
+    for stdin. column selects a CSV column by header name or 0-based index;
+    by default the first cell containing "@" is used.
+    """
+    import csv
+    handle = open_email_list(path)
+    is_csv = column is not None or path.removesuffix(".gz").endswith(".csv")
+    try:
+        if not is_csv:
+            for line in handle:
+                yield line.strip()
+            return
+
+        reader = csv.reader(handle)
+        index = None
+        if column is not None:
+            if str(column).isdigit():
+                index = int(column)
+            else:
+                header = next(reader, [])
+                normalized = [cell.strip().lower() for cell in header]
+                if column.strip().lower() not in normalized:
+                    raise ValueError(f"Column '{column}' not found in CSV header")
+                index = normalized.index(column.strip().lower())
+        for row in reader:
+            if index is not None:
+                if index < len(row):
+                    yield row[index].strip()
+            else:
+                yield next((cell.strip() for cell in row if "@" in cell), "")
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+def read_email_rows(path, column=None, extra_columns=()):
+    """Yield (email, *extra cells) rows from a list, one at a time.
+
+    Like read_email_list, but every line is read as CSV and each row also
+    carries the cells of extra_columns (header names or 0-based indexes,
+    None for a column that isn't used; missing cells are ""), so a plain
+    "email,priority,deadline" list works without a header.
+    """
+    import csv
+    handle = open_email_list(path)
+    try:
+        reader = csv.reader(handle)
+        columns = [column, *extra_columns]
+        indexes = [int(c) if c is not None and str(c).isdigit() else None for c in columns]
+        named = [c is not None and not str(c).isdigit() for c in columns]
+        if any(named):
+            header = [cell.strip().lower() for cell in next(reader, [])]
+            for position, name in enumerate(columns):
+                if named[position]:
+                    if name.strip().lower() not in header:
+                        raise ValueError(f"Column '{name}' not found in CSV header")
+                    indexes[position] = header.index(name.strip().lower())
+        email_index, extra_indexes = indexes[0], indexes[1:]
+        for row in reader:
+            if email_index is not None:
+                email = row[email_index].strip() if email_index < len(row) else ""
+            else:
+                email = next((cell.strip() for cell in row if "@" in cell), "")
+            yield (email,) + tuple(row[i].strip() if i is not None and i < len(row) else ""
+                                   for i in extra_indexes)
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+class FingerprintSet:
+    """Compact set of 64-bit fingerprints used to drop duplicate emails.
+
+    An open-addressing hash table in an array of unsigned 64-bit integers,
+    so each address costs 16 bytes at most instead of a full Python string
+    in a set. That keeps deduplication of multi-million line lists small.
+    """
+
+    def __init__(self, capacity=1024):
+        self._slots = array('Q', [0]) * capacity
+        self._mask = capacity - 1
+        self._count = 0
+
+    @staticmethod
+    def fingerprint(value):
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'little') or 1  # 0 marks an empty slot
+
+    def add(self, value):
+        """Add value, returning False if it was already present"""
+        fingerprint = self.fingerprint(value)
+        slots = self._slots
+        index = fingerprint & self._mask
+        while True:
+            slot = slots[index]
+            if slot == 0:
+                slots[index] = fingerprint
+                self._count += 1
+                if self._count * 2 > len(slots):
+                    self._grow()
+                return True
+            if slot == fingerprint:
+                return False
+            index = (index + 1) & self._mask
+
+    def _grow(self):
+        old_slots = self._slots
+        self._slots = array('Q', [0]) * (len(old_slots) * 2)
+        self._mask = len(self._slots) - 1
+        for fingerprint in old_slots:
+            if fingerprint:
+                index = fingerprint & self._mask
+                while self._slots[index]:
+                    index = (index + 1) & self._mask
+                self._slots[index] = fingerprint
+
+    def __len__(self):
+        return self._count
+
+def iter_unique_emails(candidates, stats):
+    """Normalize and deduplicate candidate addresses, counting into stats"""
+    seen = FingerprintSet()
+    for candidate in candidates:
+        stats["lines_read"] += 1
+        if not candidate or not is_valid_email(candidate):
+            stats["invalid"] += 1
+            continue
+        email = normalize_email(candidate)
+        if not seen.add(email):
+            stats["duplicates"] += 1
+            continue
+        stats["unique"] += 1
+        yield email
+
+def iter_unique_rows(rows, stats):
+    """Like iter_unique_emails for (email, ...) rows, keeping a row's first occurrence"""
+    seen = FingerprintSet()
+    for row in rows:
+        stats["lines_read"] += 1
+        candidate = row[0]
+        if not candidate or not is_valid_email(candidate):
+            stats["invalid"] += 1
+            continue
+        email = normalize_email(candidate)
+        if not seen.add(email):
+            stats["duplicates"] += 1
+            continue
+        stats["unique"] += 1
+        yield (email,) + tuple(row[1:])
+
+def new_ingest_stats():
+    return {"lines_read": 0, "invalid": 0, "duplicates": 0, "unique": 0, "skipped_completed": 0,
+            "other_shards": 0, "invalid_schedule": 0}
+
+def parse_shard(text):
+    """Parse a --shard value "K/N" into (K, N), with 1 <= K <= N"""
+    index, _, count = text.partition("/")
+    index, count = int(index), int(count)
+    if not 1 <= index <= count:
+        raise ValueError(f"shard {text} is out of range, expected K/N with 1 <= K <= N")
+    return index, count
+
+def shard_of(email, count):
+    """Shard (1-based) a normalized email belongs to when a list is split count ways.
+
+    Based on a hash of the address alone, so every invocation given the
+    same list (in any order) agrees on the split.
+    """
+    digest = hashlib.blake2b(email.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % count + 1
+
+# Preference when the same email appears in several merged results
+MERGE_STATUS_RANK = {"success": 3, "no_data": 2, "timeout": 1}
+
+def merge_results(paths, output_path):
+    """Combine results files (.json sessions or .jsonl streams) into one session file.
+
+    Investigations are deduplicated by normalized email, keeping the most
+    conclusive one (success, then no_data, then timeout, then failures)
+    and, among equals, the most recent. Returns the merged session or None.
+    """
+    merged = {}
+    sources = []
+    start_times = []
+    end_times = []
+    total = 0
+    for path in paths:
+        infos = []
+        count = 0
+        try:
+            if path.endswith(".jsonl"):
+                records = []
+                for session_info, record in iter_stream_records(path):
+                    if session_info is not None:
+                        infos.append(session_info)
+                    else:
+                        records.append(record)
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    session = json.load(f)
+                infos.append(session.get("session_info", {}))
+                records = session.get("investigations", [])
+        except (OSError, ValueError) as e:
+            print(f"{RGBColors.GOOGLE_RED}✗ Could not read {path}: {str(e)}{RGBColors.reset()}")
+            return None
+
+        for record in records:
+            email = record.get("email")
+            if not email:
+                continue
+            count += 1
+            key = normalize_email(email)
+            rank = (MERGE_STATUS_RANK.get(record.get("status"), 0), record.get("timestamp") or "")
+            current = merged.get(key)
+            if current is None or rank > current[0]:
+                merged[key] = (rank, record)
+        total += count
+
+        # A stream's trailer (the last session_info) is the most complete one
+        info = infos[-1] if infos else {}
+        if info.get("start_time"):
+            start_times.append(info["start_time"])
+        if info.get("end_time"):
+            end_times.append(info["end_time"])
+        sources.append({"file": os.path.relpath(path), "shard": info.get("shard"),
+                        "investigations": count, "start_time": info.get("start_time"),
+                        "end_time": info.get("end_time")})
+
+    session = {
+        "session_info": {
+            "start_time": min(start_times) if start_times else datetime.now().isoformat(),
+            "tool_version": "1.0",
+            "total_investigations": len(merged),
+            "end_time": max(end_times) if end_times else datetime.now().isoformat(),
+            "merged_from": sources,
+            "duplicates_removed": total - len(merged),
+        },
+        "investigations": [record for _, record in merged.values()],
+    }
+    try:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(session, f, indent=2, ensure_ascii=False)
+    except OSError as e:
+        print(f"{RGBColors.GOOGLE_RED}✗ Error saving merged results: {str(e)}{RGBColors.reset()}")
+        return None
+    print(f"{RGBColors.GOOGLE_GREEN}✓ Merged {total} investigation(s) from {len(paths)} file(s) into "
+          f"{len(merged)} ({total - len(merged)} duplicate(s) removed): {os.path.relpath(output_path)}{RGBColors.reset()}")
+    return session
+
+# Statuses an investigation can end with; --retry-failed re-runs the last three
+FINAL_STATUSES = ("success", "no_data", "failed", "timeout", "error")
+RETRYABLE_STATUSES = ("failed", "timeout", "error")
+
+def load_checkpoint(path):
+    """Return {normalized email: last status} from a checkpoint or results file.
+
+    Accepts a .checkpoint file, a JSONL results stream or a session JSON file.
+    """
+    statuses = {}
+    if path.endswith(".json"):
+        with open(path, 'r', encoding='utf-8') as f:
+            investigations = json.load(f).get("investigations", [])
+    else:
+        investigations = (record for info, record in iter_stream_records(path) if record is not None)
+    for investigation in investigations:
+        email = investigation.get("email")
+        if email and investigation.get("status") in FINAL_STATUSES:
+            statuses[normalize_email(email)] = investigation["status"]
+    return statuses
+
+# Error text GHunt/Google produce when we are being throttled
+RATE_LIMIT_RE = re.compile(r'\b429\b|rate.?limit|too many requests|quota exceeded|/sorry/|'
+                           r'blocked by google|unusual traffic', re.IGNORECASE)
+
+def rate_limit_signature(investigation_data):
+    """Return the throttling message found in a finished investigation, or None"""
+    texts = [investigation_data.get("error", "")]
+    if investigation_data.get("status") == "success":
+        texts += [line for line in investigation_data.get("raw_output", []) if line.startswith("[-]")]
+    for text in texts:
+        match = RATE_LIMIT_RE.search(text or "")
+        if match:
+            return match.group(0)
+    return None
+
+# Error text of failures that may go away on a later attempt (network trouble, server errors)
+TRANSIENT_ERROR_RE = re.compile(r'timed? ?out|connection|network|temporar|unreachable|reset by peer|'
+                                r'\b50[0234]\b|service unavailable|try again', re.IGNORECASE)
+
+def is_transient_failure(investigation_data):
+    """True for timeouts and for failures whose error looks transient (deferred retries)"""
+    status = investigation_data.get("status")
+    if status == "timeout":
+        return True
+    if status not in RETRYABLE_STATUSES:
+        return False
+    error = investigation_data.get("error", "") or ""
+    return TRANSIENT_ERROR_RE.search(error) is not None or RATE_LIMIT_RE.search(error) is not None
+
+# Error text GHunt produces when a credentials file is missing, expired or rejected
+AUTH_ERROR_RE = re.compile(r'GHuntInvalidSession|GHuntLoginError|GHuntAndroidMasterAuthError|ghunt login|'
+                           r'stored session|session unavailable|not logged in|\b401\b|unauthori[sz]ed', re.IGNORECASE)
+
+def auth_error_signature(investigation_data):
+    """Return the authentication error of a failed investigation, or None"""
+    if investigation_data.get("status") not in RETRYABLE_STATUSES:
+        return None
+    match = AUTH_ERROR_RE.search(investigation_data.get("error", "") or "")
+    return match.group(0) if match else None
+
+class AdaptiveRateLimiter:
+    """Token bucket pacing GHunt calls, backing off when Google throttles us.
+
+    acquire() blocks until a call may start. When a throttled response is
+    reported the rate is halved and every worker pauses for a cool-down.
+    Without a configured limit the starting point is the rate at which calls
+    completed over the last window, or default_rate until enough calls have
+    finished. Throttles reported while a cool-down is running come from calls
+    already in flight and don't slow down further. The cool-down doubles on
+    each new throttle and only starts from backoff again once no throttling
+    was seen for quiet_period seconds. Each successful call raises the rate
+    again by a small step, up to the configured maximum.
+    """
+
+    def __init__(self, rate=None, max_retries=3, backoff=5.0, max_backoff=300.0,
+                 min_rate=0.05, recovery_step=0.05, default_rate=1.0, window=60.0,
+                 quiet_period=120.0):
+        self.max_rate = rate
+        self.rate = rate
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.min_rate = min_rate
+        self.recovery_step = recovery_step
+        self.default_rate = default_rate
+        self.window = window
+        self.quiet_period = quiet_period
+        self.tokens = 1.0
+        self.last_refill = time.monotonic()
+        self.first_call = None
+        self.cooldown_until = 0.0
+        self.consecutive_throttles = 0
+        self.completed_calls = deque()
+        self.throttle_count = 0
+        self.retry_count = 0
+        self.events = deque(maxlen=100)
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Wait for a token (and for any active cool-down) before a GHunt call"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self.cooldown_until - now
+                if wait <= 0 and self.rate is not None:
+                    self.tokens = min(1.0, self.tokens + (now - self.last_refill) * self.rate)
+                    self.last_refill = now
+                    wait = 0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+                if wait <= 0:
+                    if self.rate is not None:
+                        self.tokens -= 1
+                    if self.first_call is None:
+                        self.first_call = now
+                    return
+            time.sleep(min(wait, 1.0))
+
+    def _complete(self, now):
+        """Count a finished call, keeping only those inside the window"""
+        self.completed_calls.append(now)
+        while self.completed_calls and self.completed_calls[0] < now - self.window:
+            self.completed_calls.popleft()
+
+    def observed_rate(self, now=None):
+        """Calls completed per second over the recent window (default_rate until there are a few)"""
+        now = time.monotonic() if now is None else now
+        span = min(self.window, now - self.first_call) if self.first_call is not None else 0
+        if len(self.completed_calls) < 3 or span <= 0:
+            return self.default_rate
+        return len(self.completed_calls) / span
+
+    def on_throttle(self, email, signature):
+        """Slow down after a throttled call and return the cool-down in seconds"""
+        with self._lock:
+            now = time.monotonic()
+            self._complete(now)
+            self.throttle_count += 1
+            if now < self.cooldown_until:
+                # Already backing off; this call was started before the pause
+                return self.cooldown_until - now
+            if now - self.cooldown_until > self.quiet_period:
+                self.consecutive_throttles = 0
+            current = self.rate if self.rate is not None else self.observed_rate(now)
+            self.rate = max(self.min_rate, current / 2)
+            self.tokens = 0.0
+            self.consecutive_throttles += 1
+            cooldown = min(self.max_backoff, self.backoff * 2 ** (self.consecutive_throttles - 1))
+            self.cooldown_until = now + cooldown
+            self.events.append({
+                "time": datetime.now().isoformat(),
+                "email": email,
+                "signature": signature,
+                "new_rate": round(self.rate, 3),
+                "cooldown_seconds": cooldown
+            })
+            return cooldown
+
+    def on_success(self):
+        """Raise the rate a step after a call that wasn't throttled"""
+        with self._lock:
+            self._complete(time.monotonic())
+            if self.rate is not None:
+                self.rate += self.recovery_step
+                if self.max_rate is not None:
+                    self.rate = min(self.max_rate, self.rate)
+
+    def on_retry(self):
+        """Count a retried investigation"""
+        with self._lock:
+            self.retry_count += 1
+
+    def stats(self):
+        """Throttling summary for session_info"""
+        return {
+            "configured_rate": self.max_rate,
+            "current_rate": round(self.rate, 3) if self.rate is not None else None,
+            "throttle_events": self.throttle_count,
+            "retries": self.retry_count,
+            "events": list(self.events)
+        }
+
+class AdaptiveTimeout:
+    """GHunt time limit that follows the latency seen so far in a batch.
+
+    The limit is `multiplier` times the p95 of the most recent completed
+    runs, kept between `minimum` and `ceiling` (the --timeout value). The
+    ceiling is used until `warmup` runs have completed.
+    """
+
+    def __init__(self, ceiling, multiplier=3.0, minimum=5.0, window=200, warmup=10):
+        self.ceiling = ceiling
+        self.multiplier = multiplier
+        self.minimum = min(minimum, ceiling)
+        self.warmup = warmup
+        self.samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        """Add the duration of a run that completed (success or no data)"""
+        with self._lock:
+            self.samples.append(seconds)
+
+    def p95(self):
+        with self._lock:
+            if len(self.samples) < self.warmup:
+                return None
+            ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def current(self):
+        """Time limit for the next run, in seconds"""
+        p95 = self.p95()
+        if p95 is None:
+            return self.ceiling
+        return max(self.minimum, min(self.ceiling, p95 * self.multiplier))
+
+    def stats(self):
+        p95 = self.p95()
+        return {"multiplier": self.multiplier, "ceiling_seconds": self.ceiling,
+                "p95_seconds": round(p95, 3) if p95 is not None else None,
+                "timeout_seconds": round(self.current(), 3)}
+
+def profile_environment(home):
+    """Environment variables that make a `ghunt` process use the credentials under home.
+
+    GHunt reads ~/.malfrats/ghunt/creds.m, so home replaces the home
+    directory; the user site-packages stay where they were, in case GHunt
+    was installed with `pip install --user`.
+    """
+    import site
+    return {"HOME": home, "USERPROFILE": home,
+            "PYTHONUSERBASE": os.environ.get("PYTHONUSERBASE") or site.getuserbase()}
+
+class CredentialProfile:
+    """One GHunt credentials file and the usage counters of its profile"""
+
+    def __init__(self, name, path, home):
+        self.name = name
+        self.path = path
+        # Fake home directory where GHunt finds the file as ~/.malfrats/ghunt/creds.m
+        self.home = home
+        self.engine = None
+        self.in_flight = 0
+        self.last_used = 0.0
+        self.cooldown_until = 0.0
+        self.consecutive_errors = 0
+        self.counts = dict.fromkeys(("calls", "success", "no_data", "failed", "rate_limited",
+                                     "auth_errors", "cooldowns"), 0)
+        self.total_seconds = 0.0
+        self.latencies = deque(maxlen=1000)
+        self.lock = threading.Lock()
+
+class CredentialPool:
+    """Pool of GHunt credential profiles shared by the workers of a run.
+
+    Each GHunt run checks out the healthy profile with the fewest runs in
+    flight (the least recently used among equals) and hands it back with
+    release(). A profile whose run is throttled or fails to authenticate is
+    put on a cool-down that doubles with every consecutive error (auth
+    errors start ten times longer), so work shifts to the other profiles.
+    When every profile is cooling down, acquire() waits for the first to
+    recover.
+    """
+
+    def __init__(self, paths, cooldown=60.0, max_cooldown=3600.0):
+        import tempfile
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.root = tempfile.mkdtemp(prefix="goosint-creds-")
+        # The homes link to (or copy) the user's credentials, so they must not
+        # outlive the process even when close() is never reached
+        atexit.register(self._remove_homes)
+        self.profiles = []
+        names = set()
+        for path in paths:
+            name = os.path.splitext(os.path.basename(path))[0]
+            if name in names:
+                name = f"{name}-{len(self.profiles) + 1}"
+            names.add(name)
+            self.profiles.append(CredentialProfile(name, path, self._make_home(name, path)))
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def expand(paths):
+        """Credentials files named by paths, where a directory stands for its *.m files"""
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                files.extend(sorted(glob.glob(os.path.join(path, "*.m"))))
+            elif os.path.isfile(path):
+                files.append(path)
+            else:
+                raise ValueError(f"Credentials file not found: {path}")
+        if not files:
+            raise ValueError("No credentials files (*.m) found")
+        return files
+
+    def _make_home(self, name, path):
+        """Create the fake home directory of a profile"""
+        ghunt_folder = os.path.join(self.root, name, ".malfrats", "ghunt")
+        os.makedirs(ghunt_folder)
+        creds = os.path.join(ghunt_folder, "creds.m")
+        try:
+            # A link lets GHunt write refreshed cookies back to the original file
+            os.symlink(os.path.abspath(path), creds)
+        except OSError:
+            shutil.copyfile(path, creds)
+        return os.path.join(self.root, name)
+
+    def acquire(self):
+        """Check out the profile for the next GHunt run"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                healthy = [profile for profile in self.profiles if profile.cooldown_until <= now]
+                if healthy:
+                    profile = min(healthy, key=lambda p: (p.in_flight, p.last_used))
+                    profile.in_flight += 1
+                    profile.last_used = now
+                    return profile
+                wait = min(profile.cooldown_until for profile in self.profiles) - now
+                self._cond.wait(min(wait, 1.0))
+
+    def release(self, profile, investigation_data, seconds):
+        """Count a finished run and cool the profile down when it was throttled or rejected.
+
+        Returns the cool-down in seconds, or None when the profile stays healthy.
+        """
+        investigation_data = investigation_data or {"status": "error"}
+        status = investigation_data.get("status")
+        kind = None
+        if rate_limit_signature(investigation_data):
+            kind = "rate_limited"
+        elif auth_error_signature(investigation_data):
+            kind = "auth_errors"
+        cooldown = None
+        with self._cond:
+            profile.in_flight -= 1
+            profile.counts["calls"] += 1
+            profile.total_seconds += seconds
+            profile.latencies.append(seconds)
+            if kind is not None:
+                profile.counts[kind] += 1
+                profile.counts["cooldowns"] += 1
+                profile.consecutive_errors += 1
+                base = self.cooldown * (10 if kind == "auth_errors" else 1)
+                cooldown = min(self.max_cooldown, base * 2 ** (profile.consecutive_errors - 1))
+                profile.cooldown_until = time.monotonic() + cooldown
+            else:
+                profile.consecutive_errors = 0
+                profile.counts[status if status in ("success", "no_data") else "failed"] += 1
+            self._cond.notify_all()
+        return cooldown
+
+    def engine_for(self, profile):
+        """The in-process GHunt engine authenticated with a profile, started on first use"""
+        with profile.lock:
+            if profile.engine is None:
+                profile.engine = GHuntLibraryEngine(profile.path)
+            return profile.engine
+
+    def stats(self):
+        """Per-profile counters and latencies for session_info"""
+        now = time.monotonic()
+        profiles = {}
+        with self._cond:
+            for profile in self.profiles:
+                ordered = sorted(profile.latencies)
+                calls = profile.counts["calls"]
+                profiles[profile.name] = dict(
+                    profile.counts,
+                    file=profile.path,
+                    success_rate=round(profile.counts["success"] / calls, 3) if calls else None,
+                    latency_mean_seconds=round(profile.total_seconds / calls, 3) if calls else None,
+                    latency_p50_seconds=round(ordered[len(ordered) // 2], 3) if ordered else None,
+                    latency_p95_seconds=(round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3)
+                                         if ordered else None),
+                    cooling_down_seconds=round(max(0.0, profile.cooldown_until - now), 1),
+                )
+        return profiles
+
+    def close(self):
+        """Stop the profiles' engines and remove their fake home directories"""
+        for profile in self.profiles:
+            if profile.engine is not None:
+                profile.engine.close()
+                profile.engine = None
+        self._remove_homes()
+        atexit.unregister(self._remove_homes)
+
+    def _remove_homes(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+# Priority given to lines of a drop file that don't set one (list rows default to 0)
+DROP_FILE_PRIORITY = 10
+
+DURATION_RE = re.compile(r'^\+?(\d+(?:\.\d+)?)\s*([smhd])$', re.IGNORECASE)
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+def parse_priority(text, default=0):
+    """Parse a priority cell; higher numbers are more urgent"""
+    text = text.strip()
+    return int(text) if text else default
+
+def parse_deadline(text):
+    """Parse a deadline cell into a Unix timestamp, or None when it is empty.
+
+    Accepts an ISO 8601 date/time (local time unless it has an offset) or a
+    duration from now such as "90s", "30m", "2h" or "1d".
+    """
+    text = text.strip()
+    if not text:
+        return None
+    match = DURATION_RE.match(text)
+    if match:
+        return time.time() + float(match.group(1)) * DURATION_UNITS[match.group(2).lower()]
+    return datetime.fromisoformat(text).timestamp()
+
+ScheduledEmail = namedtuple("ScheduledEmail", ["email", "priority", "deadline", "queued_at", "source"])
+
+class BatchScheduler:
+    """Priority queue that hands out the most urgent waiting email of a batch.
+
+    Emails are ordered by priority (highest first), then deadline (earliest
+    first, none last), then the order they were added. Workers take one with
+    next_email() and hand it back with finish(). Lines appended to the drop
+    file ("email[,priority[,deadline]]") are added while the batch runs;
+    dropping an email that is still waiting moves it up when the new
+    priority or deadline is more urgent. accept(email) filters what is added.
+    """
+
+    def __init__(self, drop_file=None, accept=None):
+        self.drop_file = drop_file
+        self.drop_offset = 0
+        self.drop_partial = ""
+        self.accept = accept if accept is not None else (lambda email: True)
+        self.heap = []
+        self.waiting = {}
+        self.seen = FingerprintSet()
+        self.sequence = iter(range(sys.maxsize))
+        self.running = 0
+        self.closed = False
+        self.queued = 0
+        self.dropped = 0
+        self.raised = 0
+        self.drop_invalid = 0
+        self.latencies = {}
+        self._cond = threading.Condition()
+
+    def add(self, email, priority=0, deadline=None, source="list"):
+        """Queue a normalized email; returns False if it is already running or finished"""
+        with self._cond:
+            key = (-priority, deadline if deadline is not None else float("inf"))
+            entry = self.waiting.get(email)
+            if entry is not None:
+                if key >= tuple(entry[:2]):
+                    return True
+                entry[3] = None  # superseded, skipped when popped
+                self.raised += 1
+            elif not self.seen.add(email):
+                return False
+            else:
+                self.queued += 1
+            item = ScheduledEmail(email, priority, deadline, time.monotonic(), source)
+            entry = [key[0], key[1], next(self.sequence), item]
+            self.waiting[email] = entry
+            heapq.heappush(self.heap, entry)
+            self._cond.notify()
+            return True
+
+    def poll(self):
+        """Add the lines appended to the drop file since the last call"""
+        import csv
+        if self.drop_file is None:
+            return
+        try:
+            size = os.path.getsize(self.drop_file)
+        except OSError:
+            return
+        if size < self.drop_offset:
+            # The file was truncated or replaced, read it again from the start
+            self.drop_offset, self.drop_partial = 0, ""
+        if size == self.drop_offset:
+            return
+        with open(self.drop_file, 'r', encoding='utf-8', errors='replace') as f:
+            f.seek(self.drop_offset)
+            data = self.drop_partial + f.read()
+            self.drop_offset = f.tell()
+        lines = data.split("\n")
+        # Keep a line that is still being written for the next poll
+        self.drop_partial = lines.pop()
+        queued = self.queued
+        for cells in csv.reader(line for line in lines if line.strip()):
+            cells = [cell.strip() for cell in cells] + ["", ""]
+            try:
+                if not is_valid_email(cells[0]):
+                    raise ValueError(cells[0])
+                email = normalize_email(cells[0])
+                priority = parse_priority(cells[1], DROP_FILE_PRIORITY)
+                deadline = parse_deadline(cells[2])
+            except ValueError:
+                self.drop_invalid += 1
+                continue
+            if self.accept(email):
+                self.add(email, priority, deadline, "drop")
+        self.dropped += self.queued - queued
+
+    def next_email(self):
+        """Take the most urgent waiting email, or None once nothing is left.
+
+        While other emails are still being investigated this waits, since
+        they may be followed by new lines in the drop file.
+        """
+        with self._cond:
+            while True:
+                self.poll()
+                while self.heap and self.heap[0][3] is None:
+                    heapq.heappop(self.heap)
+                if self.heap and not self.closed:
+                    item = heapq.heappop(self.heap)[3]
+                    del self.waiting[item.email]
+                    self.running += 1
+                    return item
+                if self.closed or self.running == 0:
+                    return None
+                self._cond.wait(1.0)
+
+    def finish(self, item, started):
+        """Mark an email taken with next_email as done and return its "schedule" record"""
+        now = time.monotonic()
+        schedule = {"priority": item.priority, "source": item.source,
+                    "wait_seconds": round(started - item.queued_at, 3),
+                    "turnaround_seconds": round(now - item.queued_at, 3)}
+        with self._cond:
+            self.running -= 1
+            latency = self.latencies.setdefault(item.priority, {"turnaround": [], "wait": [],
+                                                                "deadlines": 0, "missed": 0})
+            latency["turnaround"].append(now - item.queued_at)
+            latency["wait"].append(started - item.queued_at)
+            if item.deadline is not None:
+                schedule["deadline"] = datetime.fromtimestamp(item.deadline).isoformat(timespec="seconds")
+                schedule["deadline_missed"] = time.time() > item.deadline
+                latency["deadlines"] += 1
+                latency["missed"] += schedule["deadline_missed"]
+            self._cond.notify_all()
+        return schedule
+
+    def close(self):
+        """Stop handing out emails"""
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    @staticmethod
+    def _percentile(samples, fraction):
+        ordered = sorted(samples)
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))], 3)
+
+    def stats(self):
+        """Queue counters and per-priority latencies for session_info"""
+        with self._cond:
+            priorities = {}
+            for priority in sorted(self.latencies, reverse=True):
+                latency = self.latencies[priority]
+                turnaround = latency["turnaround"]
+                priorities[str(priority)] = {
+                    "investigations": len(turnaround),
+                    "wait_p50_seconds": self._percentile(latency["wait"], 0.5),
+                    "turnaround_p50_seconds": self._percentile(turnaround, 0.5),
+                    "turnaround_p95_seconds": self._percentile(turnaround, 0.95),
+                    "turnaround_max_seconds": round(max(turnaround), 3),
+                    "deadlines": latency["deadlines"],
+                    "deadlines_missed": latency["missed"],
+                }
+            return {"queued": self.queued, "drop_file": self.drop_file, "dropped": self.dropped,
+                    "raised": self.raised, "invalid_drops": self.drop_invalid,
+                    "not_started": len(self.waiting), "priorities": priorities}
+
+class InvestigationCache:
+    """SQLite-backed cache of parsed investigations, keyed by normalized email"""
+
+    # Only definitive answers are cached; failures and timeouts are always retried
+    CACHEABLE_STATUSES = ("success", "no_data")
+
+    def __init__(self, path, ttl_hours=24, max_entries=50000):
+        import sqlite3
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS investigations ("
+            "email TEXT PRIMARY KEY, stored_at REAL NOT NULL, data TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_stored_at ON investigations (stored_at)")
+        self.purge_expired()
+
+    def get(self, email):
+        """Return the cached investigation for email, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM investigations WHERE email = ? AND stored_at >= ?",
+                (normalize_email(email), time.time() - self.ttl_seconds)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, email, investigation_data):
+        """Store a finished investigation and evict the oldest entries over the size limit"""
+        if investigation_data.get("status") not in self.CACHEABLE_STATUSES:
+            return
+        data = json.dumps(investigation_data, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO investigations (email, stored_at, data) VALUES (?, ?, ?)",
+                (normalize_email(email), time.time(), data)
+            )
+            self._conn.execute(
+                "DELETE FROM investigations WHERE email IN ("
+                "SELECT email FROM investigations ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def purge_expired(self):
+        """Drop entries older than the TTL"""
+        with self._lock:
+            self._conn.execute("DELETE FROM investigations WHERE stored_at < ?",
+                               (time.time() - self.ttl_seconds,))
+            self._conn.commit()
+
+    def stats(self):
+        """Hit/miss counters for session_info"""
+        return {"hits": self.hits, "misses": self.misses,
+                "ttl_hours": self.ttl_seconds / 3600, "max_entries": self.max_entries}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+QUERY_TERM_RE = re.compile(r'^(\w+)(:|>=|<=|>|<)(.*)$')
+
+def parse_query(text):
+    """Split a --query string into (field, operator, value) terms.
+
+    Terms are separated by whitespace and all have to match: field:value
+    for equality (value * matches any value), field>N, field>=N, field<N
+    and field<=N for numeric comparisons. A bare term matches an email
+    address or a Gaia ID.
+    """
+    terms = []
+    for token in text.split():
+        match = QUERY_TERM_RE.match(token)
+        if match is None:
+            terms.append((None, ":", token))
+        else:
+            terms.append(match.groups())
+    return terms
+
+class ResultsIndex:
+    """SQLite index over saved investigations, for lookups across all runs.
+
+    Session files (.json) and results streams (.jsonl) are loaded
+    incrementally: a file is only read again when its size or modification
+    time changed. Every investigation is indexed by email, Gaia ID, status
+    and timestamp, and each services field is stored as (field, value) rows,
+    one per list item.
+    """
+
+    # Query fields that map to investigation columns instead of services
+    COLUMNS = {"email": "normalized_email", "gaia": "gaia_id", "gaia_id": "gaia_id",
+               "status": "status", "since": "timestamp", "until": "timestamp"}
+
+    def __init__(self, path):
+        import sqlite3
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS investigations ("
+            "id INTEGER PRIMARY KEY, source TEXT NOT NULL, email TEXT, normalized_email TEXT, "
+            "gaia_id TEXT, status TEXT, timestamp TEXT, data TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS services ("
+            "investigation_id INTEGER NOT NULL, field TEXT NOT NULL, value TEXT);"
+            "CREATE INDEX IF NOT EXISTS idx_source ON investigations (source);"
+            "CREATE INDEX IF NOT EXISTS idx_email ON investigations (normalized_email);"
+            "CREATE INDEX IF NOT EXISTS idx_gaia_id ON investigations (gaia_id);"
+            "CREATE INDEX IF NOT EXISTS idx_status ON investigations (status, timestamp);"
+            "CREATE INDEX IF NOT EXISTS idx_timestamp ON investigations (timestamp);"
+            "CREATE INDEX IF NOT EXISTS idx_service ON services (field, value);"
+            "CREATE INDEX IF NOT EXISTS idx_service_investigation ON services (investigation_id);"
+        )
+
+    def _forget(self, source):
+        """Remove everything indexed from source"""
+        self._conn.execute("DELETE FROM services WHERE investigation_id IN "
+                           "(SELECT id FROM investigations WHERE source = ?)", (source,))
+        self._conn.execute("DELETE FROM investigations WHERE source = ?", (source,))
+        self._conn.execute("DELETE FROM files WHERE path = ?", (source,))
+
+    def index_file(self, path):
+        """Index one results file; return the number of investigations, or None if unchanged"""
+        source = os.path.abspath(path)
+        stat = os.stat(path)
+        row = self._conn.execute("SELECT size, mtime FROM files WHERE path = ?", (source,)).fetchone()
+        if row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime:
+            return None
+
+        if path.endswith(".jsonl"):
+            investigations = (record for _, record in iter_stream_records(path) if record is not None)
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                investigations = json.load(f).get("investigations", [])
+
+        count = 0
+        with self._conn:
+            self._forget(source)
+            for investigation in investigations:
+                self._insert(source, investigation)
+                count += 1
+            self._conn.execute("INSERT INTO files (path, size, mtime) VALUES (?, ?, ?)",
+                               (source, stat.st_size, stat.st_mtime))
+        return count
+
+    def _insert(self, source, investigation):
+        email = investigation.get("email")
+        record = {key: value for key, value in investigation.items() if key != "raw_output"}
+        profile = investigation.get("profile") or {}
+        services = investigation.get("services") or {}
+        if "changes" in investigation:
+            # Change records (--diff-against) are indexed by their new values
+            profile = {field: new for field, (_, new) in investigation["changes"].get("profile", {}).items()}
+            services = {field: new for field, (_, new) in investigation["changes"].get("services", {}).items()}
+        cursor = self._conn.execute(
+            "INSERT INTO investigations (source, email, normalized_email, gaia_id, status, timestamp, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (source, email, normalize_email(email) if email else None,
+             profile.get("gaia_id"), investigation.get("status"),
+             investigation.get("timestamp"), json.dumps(record, ensure_ascii=False))
+        )
+        rows = []
+        for field, value in services.items():
+            values = value if isinstance(value, list) else [value]
+            for item in values:
+                if isinstance(item, (dict, list)):
+                    item = json.dumps(item, ensure_ascii=False)
+                rows.append((cursor.lastrowid, field, None if item is None else str(item)))
+        self._conn.executemany("INSERT INTO services (investigation_id, field, value) VALUES (?, ?, ?)", rows)
+
+    def update(self, folder):
+        """Index new and changed results files in folder; return (files, investigations) indexed"""
+        paths = set(glob.glob(os.path.join(folder, "investigation_*.json")))
+        for stream_path in glob.glob(os.path.join(folder, "investigation_*.jsonl")):
+            # A stream converted with --pretty is indexed from its .json file only
+            if os.path.splitext(stream_path)[0] + ".json" in paths:
+                with self._conn:
+                    self._forget(os.path.abspath(stream_path))
+            else:
+                paths.add(stream_path)
+
+        known = {row[0] for row in self._conn.execute("SELECT path FROM files")}
+        with self._conn:
+            for source in known - {os.path.abspath(path) for path in paths}:
+                if os.path.dirname(source) == os.path.abspath(folder):
+                    self._forget(source)
+
+        files = investigations = 0
+        for path in sorted(paths):
+            try:
+                count = self.index_file(path)
+            except (OSError, ValueError) as e:
+                print(f"{RGBColors.GOOGLE_YELLOW}✗ Skipping unreadable results file {path}: {str(e)}{RGBColors.reset()}")
+                continue
+            if count is not None:
+                files += 1
+                investigations += count
+        return files, investigations
+
+    def query(self, text, limit=None):
+        """Return the investigations matching a query string, newest first"""
+        where = []
+        params = []
+        for field, operator, value in parse_query(text):
+            if field is None:
+                where.append("(i.normalized_email = ? OR i.gaia_id = ?)")
+                params += [normalize_email(value) if "@" in value else value, value]
+            elif field in self.COLUMNS:
+                column = self.COLUMNS[field]
+                if field == "since":
+                    operator = ">="
+                elif field == "until":
+                    operator = "<"
+                elif field == "email":
+                    value = normalize_email(value)
+                if operator == ":":
+                    if value == "*":
+                        where.append(f"i.{column} IS NOT NULL")
+                        continue
+                    operator = "="
+                where.append(f"i.{column} {operator} ?")
+                params.append(value)
+            else:
+                condition = "s.investigation_id = i.id AND s.field = ?"
+                params.append(field)
+                if operator != ":":
+                    condition += f" AND CAST(s.value AS REAL) {operator} ?"
+                    params.append(float(value))
+                elif value != "*":
+                    condition += " AND s.value = ?"
+                    params.append(value)
+                where.append(f"EXISTS (SELECT 1 FROM services s WHERE {condition})")
+
+        sql = "SELECT i.source, i.data FROM investigations i"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY i.timestamp DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        results = []
+        for source, data in self._conn.execute(sql, params):
+            investigation = json.loads(data)
+            investigation["source"] = os.path.relpath(source)
+            results.append(investigation)
+        return results
+
+    def history(self, email):
+        """Yield the successful records of email, oldest first, from its last full investigation on"""
+        key = normalize_email(email)
+        rows = self._conn.execute(
+            "SELECT data FROM investigations WHERE normalized_email = ? AND status = 'success' "
+            "AND timestamp >= COALESCE((SELECT MAX(timestamp) FROM investigations "
+            "WHERE normalized_email = ? AND status = 'success' "
+            "AND json_extract(data, '$.change') IS NULL), '') ORDER BY timestamp, id",
+            (key, key)
+        ).fetchall()
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def stats(self):
+        files = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        investigations = self._conn.execute("SELECT COUNT(*) FROM investigations").fetchone()[0]
+        return {"files": files, "investigations": investigations}
+
+    def close(self):
+        self._conn.close()
+
+DIFF_SECTIONS = ("profile", "services")
+
+def apply_investigation(state, record):
+    """Advance an email's known profile/services state by one saved record.
+
+    Full successful investigations replace the state; change records
+    written by --diff-against apply their [old, new] pairs on top of it.
+    Returns the new state ({"profile", "services", "timestamp"}) or the
+    unchanged one for records that carry no profile data.
+    """
+    change = record.get("change")
+    if change is None:
+        if record.get("status") != "success":
+            return state
+        state = {section: dict(record.get(section) or {}) for section in DIFF_SECTIONS}
+    elif change in ("changed", "new"):
+        state = {section: dict((state or {}).get(section) or {}) for section in DIFF_SECTIONS}
+        for section, fields in record.get("changes", {}).items():
+            for field, (_, new) in fields.items():
+                if new is None:
+                    state[section].pop(field, None)
+                else:
+                    state[section][field] = new
+    elif change != "unchanged" or state is None:
+        return state
+    state["timestamp"] = record.get("timestamp")
+    return state
+
+def diff_investigation(state, investigation_data):
+    """Return the change record of a finished investigation against the last known state.
+
+    Only successful investigations are compared; other outcomes are kept
+    as they are (without raw output). Changed fields are stored as
+    [old, new] pairs, with None for fields that appeared or disappeared.
+    """
+    record = {key: investigation_data[key] for key in ("email", "timestamp", "status")
+              if key in investigation_data}
+    if investigation_data.get("status") != "success":
+        record.update({key: value for key, value in investigation_data.items()
+                       if key in ("error", "message", "partial", "throttled", "rate_limit_retries")})
+        return record
+
+    changes = {}
+    for section in DIFF_SECTIONS:
+        old = (state or {}).get(section) or {}
+        new = investigation_data.get(section) or {}
+        fields = {field: [old.get(field), new.get(field)]
+                  for field in old.keys() | new.keys() if old.get(field) != new.get(field)}
+        if fields:
+            changes[section] = dict(sorted(fields.items()))
+    if state is None:
+        record["change"] = "new"
+    else:
+        record["change"] = "changed" if changes else "unchanged"
+        record["baseline"] = state.get("timestamp")
+    if changes:
+        record["changes"] = changes
+    return record
+
+class DiffBaseline:
+    """Last known profile/services state of each email, for --diff-against.
+
+    The source is either a results file (.json session or .jsonl stream)
+    whose records are replayed into memory, or "index" / an index.sqlite3
+    path, in which case states are rebuilt on demand from the results
+    index so daily change feeds can be chained.
+    """
+
+    def __init__(self, source, results_folder="results"):
+        self.source = source
+        self.index = None
+        self.states = {}
+        if source == "index" or source.endswith(".sqlite3"):
+            path = os.path.join(results_folder, "index.sqlite3") if source == "index" else source
+            if source != "index" and not os.path.exists(path):
+                # No index yet: every email is new
+                return
+            self.index = ResultsIndex(path)
+            if source == "index":
+                self.index.update(results_folder)
+            return
+        if source.endswith(".jsonl"):
+            records = [record for _, record in iter_stream_records(source) if record is not None]
+        else:
+            with open(source, 'r', encoding='utf-8') as f:
+                records = json.load(f).get("investigations", [])
+        records.sort(key=lambda record: record.get("timestamp") or "")
+        for record in records:
+            if record.get("email"):
+                key = normalize_email(record["email"])
+                self.states[key] = apply_investigation(self.states.get(key), record)
+
+    def get(self, email):
+        """Known state of email, or None if it was never found before"""
+        if self.index is not None:
+            state = None
+            for record in self.index.history(email):
+                state = apply_investigation(state, record)
+            return state
+        return self.states.get(normalize_email(email))
+
+    def close(self):
+        if self.index is not None:
+            self.index.close()
+
+TIMING_STAGES = ("spawn", "ghunt", "banner_filter", "parse", "render", "persist")
+
+class RunMetrics:
+    """Aggregate counters and per-stage timings for one GoOsint run.
+
+    Fed with every recorded investigation; written at the end of the run as
+    a JSON summary or, for paths ending in .prom, in the Prometheus textfile
+    format read by node_exporter's textfile collector.
+    """
+
+    # Upper bounds (seconds) of the per-investigation duration histogram
+    DURATION_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+    def __init__(self, path):
+        self.path = path
+        self.started = time.time()
+        self.statuses = {}
+        # Outcome of every GHunt attempt, including those later retried
+        self.attempts = {}
+        self.retries = 0
+        self.timeouts = 0
+        self.throttled = 0
+        self.cache_hits = 0
+        # stage -> [count, total seconds, max seconds]
+        self.stages = {stage: [0, 0.0, 0.0] for stage in TIMING_STAGES}
+        self.duration_buckets = [0] * len(self.DURATION_BUCKETS)
+        self.duration_count = 0
+        self.duration_sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe_stage(self, stage, seconds):
+        """Add one timing sample for stage"""
+        with self._lock:
+            self._add_stage(stage, seconds)
+
+    def _add_stage(self, stage, seconds):
+        entry = self.stages.setdefault(stage, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        if seconds > entry[2]:
+            entry[2] = seconds
+
+    def observe(self, investigation_data):
+        """Count a finished investigation and add its stage timings"""
+        status = investigation_data.get("status", "unknown")
+        duration = investigation_data.get("duration_seconds")
+        with self._lock:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            for attempt in investigation_data.get("previous_attempts", []) + [investigation_data]:
+                outcome = attempt.get("status", "unknown")
+                self.attempts[outcome] = self.attempts.get(outcome, 0) + 1
+                if outcome == "timeout":
+                    self.timeouts += 1
+            self.retries += (investigation_data.get("rate_limit_retries", 0)
+                             + investigation_data.get("deferred_retries", 0))
+            if investigation_data.get("throttled"):
+                self.throttled += 1
+            if investigation_data.get("cache_hit"):
+                self.cache_hits += 1
+            for stage, seconds in investigation_data.get("timings", {}).items():
+                if stage != "persist":
+                    self._add_stage(stage, seconds)
+            if duration is not None:
+                self.duration_count += 1
+                self.duration_sum += duration
+                for index, bound in enumerate(self.DURATION_BUCKETS):
+                    if duration <= bound:
+                        self.duration_buckets[index] += 1
+                        break
+
+    def to_dict(self):
+        """Return the metrics as a JSON-serializable summary"""
+        with self._lock:
+            stages = {}
+            for stage, (count, total, longest) in self.stages.items():
+                stages[stage] = {
+                    "count": count,
+                    "total_seconds": round(total, 4),
+                    "mean_seconds": round(total / count, 6) if count else 0.0,
+                    "max_seconds": round(longest, 4),
+                }
+            return {
+                "start_time": datetime.fromtimestamp(self.started).isoformat(),
+                "run_seconds": round(time.time() - self.started, 3),
+                "investigations": sum(self.statuses.values()),
+                "statuses": dict(self.statuses),
+                "attempts": dict(self.attempts),
+                "timeouts": self.timeouts,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "cache_hits": self.cache_hits,
+                "stages": stages,
+                "duration_seconds": {
+                    "count": self.duration_count,
+                    "sum": round(self.duration_sum, 4),
+                    "buckets": {str(bound): count for bound, count
+                                in zip(self.DURATION_BUCKETS, self.duration_buckets)},
+                },
+            }
+
+    def to_prometheus(self):
+        """Return the metrics in the Prometheus text exposition format"""
+        summary = self.to_dict()
+        lines = [
+            "# HELP goosint_investigations_total Investigations recorded, by status.",
+            "# TYPE goosint_investigations_total counter",
+        ]
+        for status, count in sorted(summary["statuses"].items()):
+            lines.append(f'goosint_investigations_total{{status="{status}"}} {count}')
+        lines += ["# HELP goosint_attempts_total GHunt attempts, including retried ones, by outcome.",
+                  "# TYPE goosint_attempts_total counter"]
+        for status, count in sorted(summary["attempts"].items()):
+            lines.append(f'goosint_attempts_total{{status="{status}"}} {count}')
+        for name, key, help_text in (
+                ("goosint_timeouts_total", "timeouts", "GHunt attempts that hit the time limit."),
+                ("goosint_retries_total", "retries", "Retries of rate-limited, timed out or failed GHunt runs."),
+                ("goosint_throttled_total", "throttled", "Investigations still rate-limited after all retries."),
+                ("goosint_cache_hits_total", "cache_hits", "Investigations answered from the cache.")):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter",
+                      f"{name} {summary[key]}"]
+        lines += ["# HELP goosint_stage_seconds Time spent in each investigation stage.",
+                  "# TYPE goosint_stage_seconds summary"]
+        for stage, stats in summary["stages"].items():
+            lines.append(f'goosint_stage_seconds_sum{{stage="{stage}"}} {stats["total_seconds"]}')
+            lines.append(f'goosint_stage_seconds_count{{stage="{stage}"}} {stats["count"]}')
+        lines += ["# HELP goosint_stage_max_seconds Longest single sample of each stage.",
+                  "# TYPE goosint_stage_max_seconds gauge"]
+        for stage, stats in summary["stages"].items():
+            lines.append(f'goosint_stage_max_seconds{{stage="{stage}"}} {stats["max_seconds"]}')
+        lines += ["# HELP goosint_investigation_duration_seconds End-to-end time per investigation.",
+                  "# TYPE goosint_investigation_duration_seconds histogram"]
+        cumulative = 0
+        for bound, count in summary["duration_seconds"]["buckets"].items():
+            cumulative += count
+            lines.append(f'goosint_investigation_duration_seconds_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'goosint_investigation_duration_seconds_bucket{{le="+Inf"}} '
+                     f'{summary["duration_seconds"]["count"]}')
+        lines.append(f'goosint_investigation_duration_seconds_sum {summary["duration_seconds"]["sum"]}')
+        lines.append(f'goosint_investigation_duration_seconds_count {summary["duration_seconds"]["count"]}')
+        lines += ["# HELP goosint_run_seconds Wall-clock time of the run.",
+                  "# TYPE goosint_run_seconds gauge",
+                  f"goosint_run_seconds {summary['run_seconds']}",
+                  "# HELP goosint_last_run_timestamp_seconds Unix time the run finished.",
+                  "# TYPE goosint_last_run_timestamp_seconds gauge",
+                  f"goosint_last_run_timestamp_seconds {time.time():.0f}"]
+        return "\n".join(lines) + "\n"
+
+    def write(self):
+        """Write the metrics file, replacing it atomically"""
+        if self.path.endswith(".prom"):
+            content = self.to_prometheus()
+        else:
+            content = json.dumps(self.to_dict(), indent=2) + "\n"
+        # Write then rename so collectors never read a half-written file
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, self.path)
+
+class RawOutputStore:
+    """Content-addressed, gzip-compressed store for raw GHunt output.
+
+    Each raw_output list is saved once as <root>/<xx>/<sha256>.json.gz and
+    referenced from the investigation by its digest, so identical output is
+    only stored once however often it is recorded.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.written = 0
+        self.deduplicated = 0
+
+    def path_for(self, digest):
+        return os.path.join(self.root, digest[:2], digest + ".json.gz")
+
+    def put(self, lines):
+        """Store a raw_output list and return its digest"""
+        data = json.dumps(lines, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path_for(digest)
+        if os.path.exists(path):
+            self.deduplicated += 1
+            return digest
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so a crash never leaves a truncated blob behind
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(gzip.compress(data, mtime=0))
+        os.replace(temp_path, path)
+        self.written += 1
+        return digest
+
+    def get(self, digest):
+        """Return the raw_output list stored under digest"""
+        with open(self.path_for(digest), 'rb') as f:
+            return json.loads(gzip.decompress(f.read()))
+
+    def stats(self):
+        return {"mode": "blob", "store": os.path.relpath(self.root),
+                "blobs_written": self.written, "deduplicated": self.deduplicated}
+
+def is_network_error(error):
+    """True for connection-level errors, which the ghunt command would run into as well"""
+    if isinstance(error, OSError):
+        return True
+    return any(cls.__module__.split(".")[0] in ("httpx", "httpcore", "ssl") for cls in type(error).__mro__)
+
+class GHuntLibraryEngine:
+    """Run GHunt lookups in-process, sharing one authenticated session.
+
+    GHunt's API helpers are async, so a private event loop runs on a daemon
+    thread and every lookup is submitted to it. The httpx client (and its
+    connection pool) and the loaded credentials are created once and reused
+    for every email, which removes the interpreter start-up, imports and
+    credential loading a `ghunt email` subprocess pays on each call.
+    Results are returned as structured data instead of scraped stdout.
+    creds_path selects a credentials file other than GHunt's default one.
+    """
+
+    def __init__(self, creds_path=None):
+        # Imported here so the subprocess backend works without GHunt's package
+        from ghunt.helpers import auth, calendar, gmaps, playgames
+        from ghunt.helpers.utils import get_httpx_client
+        from ghunt.apis.peoplepa import PeoplePaHttp
+        import asyncio
+        self._asyncio = asyncio
+        self._auth = auth
+        self._calendar = calendar
+        self._gmaps = gmaps
+        self._playgames = playgames
+        self._people_api = PeoplePaHttp
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self._client = get_httpx_client()
+        try:
+            if creds_path is None:
+                self.creds = self._call(self._auth.load_and_auth(self._client), timeout=60)
+            else:
+                self.creds = self._call(self._load_creds(creds_path), timeout=60)
+        except Exception:
+            self.close()
+            raise
+        self._people_pa = self._people_api(self.creds)
+
+    async def _load_creds(self, creds_path):
+        """Load and refresh the session stored in creds_path (load_and_auth for any file)"""
+        from ghunt.objects.base import GHuntCreds
+        creds = GHuntCreds(creds_path)
+        creds.load_creds()
+        await self._auth.check_and_gen(self._client, creds)
+        return creds
+
+    def _call(self, coro, timeout=None):
+        """Run a coroutine on the engine loop and wait for its result"""
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+        future = self._asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def lookup(self, email, timeout=60):
+        """Investigate one email and return (found, profile, services, output_lines).
+
+        Raises concurrent.futures.TimeoutError when the lookup takes longer
+        than timeout seconds.
+        """
+        return self._call(self._lookup(email), timeout)
+
+    async def _lookup(self, email):
+        is_found, target = await self._people_pa.people_lookup(self._client, email, params_template="max_details")
+        if not is_found or "PROFILE" not in target.sourceIds:
+            return False, {}, {}, []
+
+        container = "PROFILE"
+        profile = {}
+        services = {}
+        lines = ["[+] Target found !", "", "🙋 Google Account data", ""]
+
+        if container in target.profilePhotos:
+            if target.profilePhotos[container].isDefault:
+                lines.append("[-] Default profile picture")
+            else:
+                profile["profile_picture"] = target.profilePhotos[container].url
+                lines += ["[+] Custom profile picture !", f"=> {target.profilePhotos[container].url}", ""]
+
+        last_edit = target.sourceIds[container].lastUpdated
+        if last_edit:
+            profile["last_edit"] = last_edit.strftime('%Y/%m/%d %H:%M:%S (UTC)')
+            lines.append(f"Last profile edit : {profile['last_edit']}")
+        profile["email"] = target.emails[container].value if container in target.emails else email
+        profile["gaia_id"] = target.personId
+        lines += ["", f"Email : {profile['email']}", f"Gaia ID : {profile['gaia_id']}"]
+
+        if container in target.profileInfos:
+            lines += ["", "User types :"]
+            lines += [f"- {user_type}" for user_type in target.profileInfos[container].userTypes]
+
+        dynamite = target.extendedData.dynamiteData
+        services["chat_entity_type"] = str(dynamite.entityType)
+        services["chat_customer_id"] = dynamite.customerId if dynamite.customerId else "Not found."
+        lines += ["", "📞 Google Chat Extended Data", "",
+                  f"Entity Type : {services['chat_entity_type']}",
+                  f"Customer ID : {services['chat_customer_id']}"]
+
+        services["enterprise_user"] = str(target.extendedData.gplusData.isEntrepriseUser)
+        lines += ["", "🌐 Google Plus Extended Data", "", f"Entreprise User : {services['enterprise_user']}"]
+        if container in target.inAppReachability:
+            services["activated_services"] = list(target.inAppReachability[container].apps)
+            lines += ["", "[+] Activated Google services :"]
+            lines += [f"- {app}" for app in services["activated_services"]]
+
+        lines += ["", "🎮 Play Games data"]
+        player_results = await self._playgames.search_player(self.creds, self._client, email)
+        if player_results:
+            lines += ["", "[+] Found player profile !", "",
+                      f"Username : {player_results[0].name}", f"Player ID : {player_results[0].id}"]
+        else:
+            lines += ["", "[-] No player profile found."]
+
+        services["maps_profile"] = f"https://www.google.com/maps/contrib/{target.personId}/reviews"
+        lines += ["", "🗺️ Maps data", "", f"Profile page : {services['maps_profile']}"]
+        # GHunt 2.0.0-2.3.3 return (err, stats, reviews, photos), later versions (err, stats)
+        err, stats = (await self._gmaps.get_reviews(self._client, target.personId))[:2]
+        if err == "failed":
+            lines += ["", "[-] Your IP has been blocked by Google. Try again later."]
+        elif err == "empty":
+            lines += ["", "[-] No reviews, ratings or photos found."]
+        else:
+            lines += ["", "[Statistics]"]
+            for section, number in stats.items():
+                if number:
+                    lines.append(f"{section} : {number}")
+        for section, key in (("Reviews", "maps_reviews"), ("Photos", "maps_photos"), ("Answers", "maps_answers")):
+            if stats.get(section):
+                services[key] = str(stats[section])
+
+        lines += ["", "🗓️ Calendar data", ""]
+        cal_found, _, calendar_events = await self._calendar.fetch_all(self.creds, self._client, email)
+        if cal_found:
+            lines.append("[+] Public Google Calendar found !")
+            lines.append(f"=> {len(calendar_events.items)} event(s) found.")
+        else:
+            lines.append("[-] No public Google Calendar.")
+
+        return True, profile, services, lines
+
+    def close(self):
+        """Close the shared HTTP client and stop the engine loop"""
+        try:
+            self._call(self._client.aclose(), timeout=10)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+# Emoji that open a section in GHunt's output (gap and blue color on screen)
+SECTION_MARKERS = ['🙋', '📞', '🌐', '🎮', '🗺️', '🗓️', '🎵', '📱', '🔍']
+
+# Section titles tracked while parsing
+GHUNT_SECTIONS = {
+    "🙋 Google Account data": "google_account",
+    "📞 Google Chat Extended Data": "google_chat",
+    "🌐 Google Plus Extended Data": "google_plus",
+    "🎮 Play Games data": "play_games",
+    "🗺️ Maps data": "maps",
+    "🗓️ Calendar data": "calendar",
+    "🎵 YouTube data": "youtube",
+}
+
+# "Key : value" lines extracted into the investigation: key -> (group, field)
+GHUNT_FIELDS = {
+    "Email": ("profile", "email"),
+    "Gaia ID": ("profile", "gaia_id"),
+    "Last profile edit": ("profile", "last_edit"),
+    "Profile page": ("services", "maps_profile"),
+    "Entity Type": ("services", "chat_entity_type"),
+    "Customer ID": ("services", "chat_customer_id"),
+    "Entreprise User": ("services", "enterprise_user"),
+    "Reviews": ("services", "maps_reviews"),
+    "Photos": ("services", "maps_photos"),
+    "Answers": ("services", "maps_answers"),
+}
+
+# "- item" lists inside a section: section -> (header text, group, field)
+GHUNT_LISTS = {
+    "google_plus": ("Activated Google services", "services", "activated_services"),
+}
+
+# Status prefixes and their line kind
+LINE_KINDS = {'[+]': 'success', '[-]': 'error', '[!]': 'warning'}
+
+# Keys of lines followed by a blank line on screen
+GAP_AFTER_KEYS = {"Profile page", "Last profile edit", "User types"}
+
+_CONTENT_RE = re.compile(r'Target|Name|Email|Google ID|\[\+\]|\[-\]|Profile|YouTube|Photos')
+
+GHuntLine = namedtuple("GHuntLine", "stripped kind section field value gap_before gap_after")
+
+_BLANK_LINE = GHuntLine("", "blank", None, None, None, False, False)
+
+@lru_cache(maxsize=4096)
+def classify_ghunt_line(line):
+    """Classify one line of GHunt output for filtering, rendering and parsing.
+
+    Every line is classified once here and the result is shared by the
+    console renderer and GHuntOutputParser. Lookups are dictionary based:
+    the status prefix, the exact section title and the "Key :" part of the
+    line, so supporting a new GHunt field only needs a GHUNT_FIELDS entry.
+    Most of GHunt's output is the same from one email to the next, so
+    results are memoized.
+    """
+    stripped = line.strip()
+    if not stripped:
+        return _BLANK_LINE
+
+    # Section markers are emoji, so plain ASCII lines can skip that scan
+    has_marker = not line.isascii() and any(marker in line for marker in SECTION_MARKERS)
+    kind = LINE_KINDS.get(line[:3])
+    if kind is None:
+        if 'Name:' in line or 'Email:' in line or 'Google ID:' in line:
+            kind = "identity"
+        elif has_marker:
+            kind = "section"
+        else:
+            kind = "plain"
+    section = GHUNT_SECTIONS.get(stripped) if has_marker else None
+
+    field = value = None
+    key, separator, rest = stripped.partition(" :")
+    if separator and key in GHUNT_FIELDS:
+        field, value = key, rest.strip()
+    elif stripped.startswith("=> https://"):
+        field, value = "=>", stripped[3:]
+    gap_after = line.startswith('=>') or (separator != "" and key in GAP_AFTER_KEYS)
+
+    return GHuntLine(stripped, kind, section, field, value, has_marker, gap_after)
+
+class GHuntOutputParser:
+    """Incremental parser turning GHunt output lines into investigation data.
+
+    Lines are fed one at a time as GHunt prints them, so partial results are
+    available even if the run is cut short.
+    """
+
+    def __init__(self, email):
+        self.data = {
+            "email": email,
+            "timestamp": datetime.now().isoformat(),
+            "status": "success",
+            "google_account": {},
+            "services": {},
+            "profile": {},
+            "raw_output": []
+        }
+        self.current_section = None
+
+    def feed(self, line, info=None):
+        """Parse one line of (banner-filtered) GHunt output.
+
+        info is the line's classify_ghunt_line() result when the caller
+        already has it.
+        """
+        self.data["raw_output"].append(line)
+        if info is None:
+            info = classify_ghunt_line(line)
+        if info.kind == "blank":
+            return
+
+        if info.section:
+            self.current_section = info.section
+
+        if info.field == "=>":
+            self.data["profile"]["profile_picture"] = info.value
+        elif info.field:
+            group, name = GHUNT_FIELDS[info.field]
+            self.data[group][name] = info.value
+        elif self.current_section in GHUNT_LISTS:
+            header, group, name = GHUNT_LISTS[self.current_section]
+            if info.kind == "success" and header in info.stripped:
+                self.data[group][name] = []
+            elif info.stripped.startswith("- "):
+                self.data[group].setdefault(name, []).append(info.stripped[2:])
+
+def is_ghunt_content_line(line):
+    """True for the first line of real results after GHunt's banner"""
+    return _CONTENT_RE.search(line) is not None
+
+class ConsoleBuffer:
+    """Collects an investigation's console lines so they are written at once.
+
+    With quiet=True nothing is kept; callers check `quiet` to skip rendering
+    GHunt's output in the first place.
+    """
+
+    def __init__(self, quiet=False):
+        self.quiet = quiet
+        self.lines = []
+
+    def append(self, line):
+        if not self.quiet:
+            self.lines.append(line)
+
+    def extend(self, lines):
+        if not self.quiet:
+            self.lines.extend(lines)
+
+    def getvalue(self):
+        return "\n".join(self.lines)
+
+# Console color for each classified line kind (plain lines stay uncolored)
+LINE_COLORS = {
+    "success": RGBColors.GOOGLE_GREEN,
+    "error": RGBColors.GOOGLE_RED,
+    "warning": RGBColors.GOOGLE_YELLOW,
+    "identity": RGBColors.LIGHT_BLUE,
+    "section": RGBColors.GOOGLE_BLUE,
+}
+
+class GoOsint:
+    def __init__(self):
+        # Initialize results storage (the folder is created on first write)
+        self.results_folder = "results"
+        self.results_folder_ready = False
+        self.results_file = os.path.join(self.results_folder, f"investigation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        self.all_results = {
+            "session_info": {
+                "start_time": datetime.now().isoformat(),
+                "tool_version": "1.0",
+                "total_investigations": 0
+            },
+            "investigations": []
+        }
+        # Optional append-only JSONL output (see enable_stream)
+        self.stream_file = None
+        self.stream_path = None
+        self.stream_pretty = False
+        # Batch progress checkpoint (see enable_checkpoint)
+        self.checkpoint_file = None
+        self.checkpoint_path = None
+        # Seconds a single GHunt run may take before it is abandoned
+        self.ghunt_timeout = 60
+        # Optional latency-based limit below ghunt_timeout (see enable_adaptive_timeout)
+        self.adaptive_timeout = None
+        # Deferred retries of timed out and failed emails after a batch's main pass
+        self.deferred_retries = 0
+        self.retry_budget = 600
+        self.retry_deadline = None
+        # In-process GHunt engine; None means the `ghunt` subprocess is used
+        self.engine = None
+        self.engine_pending = None
+        self._retired_engines = []
+        self._engine_lock = threading.Lock()
+        # Pacing and throttling back-off for GHunt calls (see enable_rate_limit)
+        self.rate_limiter = None
+        # Several GHunt credentials files shared by the workers (see enable_credential_pool)
+        self.credential_pool = None
+        self.profile_engines = False
+        # Optional on-disk cache of parsed investigations (see enable_cache)
+        self.cache = None
+        self.cache_refresh = False
+        self._cache_lock = threading.Lock()
+        # Where raw GHunt output is kept: "inline", "blob" or "none" (see set_raw_output)
+        self.raw_output_mode = "inline"
+        self.raw_store = None
+        # Previous state to store changes against (see enable_diff)
+        self.diff_baseline = None
+        self.diff_counts = {}
+        # Part of the input list this process investigates (see set_shard)
+        self.shard = None
+        # Priority/deadline columns and drop file for scheduled batches (see enable_scheduling)
+        self.scheduling = None
+        # Add saved results to the SQLite results index (see enable_index)
+        self.index_results = False
+        # Quiet mode skips rendering GHunt output (see enable_quiet)
+        self.quiet = False
+        self.record_output = None
+        # Run metrics export and parse/render profiling (see enable_metrics, enable_profile)
+        self.metrics = None
+        self.profile_path = None
+        self.profiler = None
+        self._profile_lock = threading.Lock()
+
+    def enable_library_backend(self, required=False, lazy=False):
+        """Switch investigations to the in-process GHunt engine.
+
+        Falls back to the `ghunt` subprocess when GHunt can't be imported or
+        its session can't be loaded. Returns True if the engine is active.
+        With lazy=True the engine is only started before the first GHunt run,
+        so runs answered entirely from the cache never import GHunt.
+        """
+        if lazy:
+            self.engine_pending = "required" if required else "optional"
+            return True
+        if self.credential_pool is not None:
+            # Each credential profile gets its own engine, started on the profile's first run
+            try:
+                import ghunt.helpers.auth  # noqa: F401
+            except Exception as e:
+                color = RGBColors.GOOGLE_RED if required else RGBColors.GOOGLE_YELLOW
+                print(f"{color}✗ In-process GHunt engine unavailable ({str(e) or type(e).__name__}), "
+                      f"using the ghunt command instead{RGBColors.reset()}")
+                return False
+            self.profile_engines = True
+            print(f"{RGBColors.GOOGLE_GREEN}✓ Using in-process GHunt engines, one per credential profile{RGBColors.reset()}")
+            return True
+        try:
+            self.engine = GHuntLibraryEngine()
+            print(f"{RGBColors.GOOGLE_GREEN}✓ Using in-process GHunt engine with a shared session{RGBColors.reset()}")
+            return True
+        except Exception as e:
+            self.engine = None
+            color = RGBColors.GOOGLE_RED if required else RGBColors.GOOGLE_YELLOW
+            print(f"{color}✗ In-process GHunt engine unavailable ({str(e) or type(e).__name__}), "
+                  f"using the ghunt command instead{RGBColors.reset()}")
+            return False
+
+    def close(self):
+        """Release resources held for the session.
+
+        Safe to call more than once. A results stream that is still open
+        (the run ended early) gets its session_info trailer here.
+        """
+        if self.stream_file is not None:
+            try:
+                self.all_results["session_info"]["end_time"] = datetime.now().isoformat()
+                self._write_stream_record({"session_info": self.all_results["session_info"]})
+                self.stream_file.close()
+            except Exception as e:
+                print(f"{RGBColors.GOOGLE_RED}✗ Error closing results stream: {str(e)}{RGBColors.reset()}")
+            self.stream_file = None
+        if self.diff_baseline is not None:
+            self.diff_baseline.close()
+            self.diff_baseline = None
+        if self.metrics is not None:
+            self.save_metrics()
+            self.metrics = None
+        if self.profile_path is not None:
+            self.save_profile()
+            self.profile_path = None
+        if self.engine is not None:
+            self.engine.close()
+            self.engine = None
+        while self._retired_engines:
+            self._retired_engines.pop().close()
+        if self.credential_pool is not None:
+            self.credential_pool.close()
+            self.credential_pool = None
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    def enable_rate_limit(self, rate=None, max_retries=3):
+        """Pace GHunt calls to at most `rate` per second and retry throttled ones.
+
+        With rate=None calls aren't paced until Google starts throttling.
+        """
+        self.rate_limiter = AdaptiveRateLimiter(rate, max_retries)
+
+    def enable_credential_pool(self, paths, cooldown=60.0):
+        """Spread GHunt runs over several credentials files (see CredentialPool).
+
+        paths are credentials files as written by `ghunt login`, or folders
+        of *.m files. Returns False when none can be used.
+        """
+        try:
+            self.credential_pool = CredentialPool(CredentialPool.expand(paths), cooldown)
+        except (OSError, ValueError) as e:
+            print(f"{RGBColors.GOOGLE_RED}✗ Could not set up credential profiles: {str(e)}{RGBColors.reset()}")
+            return False
+        names = ", ".join(profile.name for profile in self.credential_pool.profiles)
+        print(f"{RGBColors.GOOGLE_GREEN}✓ Using {len(self.credential_pool.profiles)} GHunt credential "
+              f"profile(s): {names}{RGBColors.reset()}")
+        return True
+
+    def set_raw_output(self, mode):
+        """Choose how raw GHunt output is saved with each investigation.
+
+        "inline" keeps the raw_output list in the record, "none" drops it and
+        "blob" moves it to the compressed RawOutputStore under
+        results/blobs, leaving only its digest in raw_output_blob.
+        """
+        self.raw_output_mode = mode
+        if mode == "blob":
+            self.ensure_results_folder()
+            self.raw_store = RawOutputStore(os.path.join(self.results_folder, "blobs"))
+
+    def _store_raw_output(self, investigation_data):
+        """Apply the raw output mode to a finished investigation"""
+        if "raw_output" not in investigation_data or self.raw_output_mode == "inline":
+            return
+        raw_output = investigation_data.pop("raw_output")
+        if self.raw_store is not None:
+            investigation_data["raw_output_blob"] = self.raw_store.put(raw_output)
+
+    def enable_diff(self, source):
+        """Record only what changed since the last known state of each email.
+
+        source is a previous results file or "index" (or an index.sqlite3
+        path) for the results index. Returns True if the baseline loaded.
+        A missing index is an empty baseline, so the first run stores every
+        email as new.
+        """
+        if source == "index":
+            # The index lives in the results folder, which may not exist yet
+            self.ensure_results_folder()
+        try:
+            self.diff_baseline = DiffBaseline(source, self.results_folder)
+        except Exception as e:
+            print(f"{RGBColors.GOOGLE_RED}✗ Could not load baseline {source}: {str(e)}{RGBColors.reset()}")
+            return False
+        self.all_results["session_info"]["diff_against"] = source
+        print(f"{RGBColors.GOOGLE_GREEN}✓ Storing changes against: {source}{RGBColors.reset()}")
+        return True
+
+    def set_shard(self, index, count):
+        """Only investigate the emails of shard index (1-based) out of count.
+
+        The shard is part of the results file name, so shards started at the
+        same time in the same folder don't overwrite each other.
+        """
+        self.shard = (index, count)
+        self.all_results["session_info"]["shard"] = f"{index}/{count}"
+        base = os.path.splitext(self.results_file)[0]
+        self.results_file = f"{base}_shard{index}of{count}.json"
+
+    def enable_scheduling(self, priority_column=None, deadline_column=None, drop_file=None):
+        """Run batches most urgent first instead of in list order.
+
+        priority_column and deadline_column select the list columns holding
+        each email's priority and deadline (see parse_priority and
+        parse_deadline); emails appended to drop_file are added to the
+        running batch. The whole list is loaded into the queue up front.
+        """
+        self.scheduling = {"priority_column": priority_column, "deadline_column": deadline_column,
+                           "drop_file": drop_file}
+
+    def enable_index(self):
+        """Add this run's results file to the results index when it is saved"""
+        self.index_results = True
+
+    def open_index(self):
+        """Open the SQLite index over all results files in the results folder"""
+        self.ensure_results_folder()
+        return ResultsIndex(os.path.join(self.results_folder, "index.sqlite3"))
+
+    def _index_saved_results(self, path):
+        """Add a just saved results file to the results index"""
+        if not self.index_results:
+            return
+        try:
+            index = self.open_index()
+            try:
+                index.index_file(path)
+            finally:
+                index.close()
+        except Exception as e:
+            print(f"{RGBColors.GOOGLE_YELLOW}✗ Could not update results index: {str(e)}{RGBColors.reset()}")
+
+    def query_results(self, query, export=None, limit=None):
+        """Look up past investigations in the results index and show or export them"""
+        import sqlite3
+        try:
+            index = self.open_index()
+        except Exception as e:
+            print(f"{RGBColors.GOOGLE_RED}✗ Could not open results index: {str(e)}{RGBColors.reset()}")
+            return []
+        try:
+            files, investigations = index.update(self.results_folder)
+            if files:
+                print(f"{RGBColors.GOOGLE_GREEN}✓ Indexed {investigations} investigation(s) "
+                      f"from {files} new or changed results file(s){RGBColors.reset()}")
+            started = time.perf_counter()
+            try:
+                results = index.query(query, limit)
+            except (ValueError, sqlite3.Error) as e:
+                print(f"{RGBColors.GOOGLE_RED}✗ Invalid query '{query}': {str(e)}{RGBColors.reset()}")
+                return []
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        finally:
+            index.close()
+
+        print(f"{RGBColors.LIGHT_BLUE}🔎 {len(results)} investigation(s) match '{query}' "
+              f"({elapsed_ms:.1f} ms){RGBColors.reset()}")
+        for investigation in results:
+            if self.record_output is not None:
+                self.record_output.write(json.dumps(investigation, ensure_ascii=False,
+                                                    separators=(",", ":")) + "\n")
+                continue
+            gaia_id = (investigation.get("profile") or {}).get("gaia_id")
+            if gaia_id is None and "changes" in investigation:
+                gaia_id = investigation["changes"].get("profile", {}).get("gaia_id", [None, None])[1]
+            gaia_id = gaia_id or "-"
+            color = RGBColors.GOOGLE_GREEN if investigation.get("status") == "success" else RGBColors.GOOGLE_YELLOW
+            print(f"{investigation.get('timestamp', '')[:19]}  {color}{investigation.get('status', ''):<8}"
+                  f"{RGBColors.reset()}  {investigation.get('email', ''):<32}  {gaia_id:<21}  "
+                  f"{investigation['source']}")
+        if export:
+            self.export_query_results(results, export)
+        return results
+
+    def export_query_results(self, results, path):
+        """Write query results to a .csv file or, for any other name, as JSONL"""
+        import csv
+        try:
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                if path.endswith(".csv"):
+                    writer = csv.writer(f)
+                    writer.writerow(["timestamp", "email", "status", "gaia_id", "source", "services"])
+                    for investigation in results:
+                        writer.writerow([investigation.get("timestamp"), investigation.get("email"),
+                                         investigation.get("status"),
+                                         (investigation.get("profile") or {}).get("gaia_id"),
+                                         investigation["source"],
+                                         json.dumps(investigation.get("services") or {}, ensure_ascii=False)])
+                else:
+                    for investigation in results:
+                        f.write(json.dumps(investigation, ensure_ascii=False) + "\n")
+            print(f"{RGBColors.GOOGLE_GREEN}✓ Exported {len(results)} investigation(s) to: {path}{RGBColors.reset()}")
+        except Exception as e:
+            print(f"{RGBColors.GOOGLE_RED}✗ Error exporting query results: {str(e)}{RGBColors.reset()}")
+
+    def enable_quiet(self, records=None):
+        """Skip rendering GHunt's output and the per-email console messages.
+
+        With records (a text stream), every investigation is also written to
+        it as one compact JSON line, without the raw GHunt output.
+        """
+        self.quiet = True
+        self.record_output = records
+
+    def enable_adaptive_timeout(self, multiplier=3.0):
+        """Lower the GHunt time limit to a multiple of the batch's running p95 latency"""
+        self.adaptive_timeout = AdaptiveTimeout(self.ghunt_timeout, multiplier)
+
+    def enable_deferred_retries(self, retries=1, budget=600):
+        """Retry timed out and transiently failed emails after a batch's main pass.
+
+        Each email gets up to `retries` more attempts, all within `budget`
+        seconds in total, with the full --timeout instead of the adaptive one.
+        Retried emails are recorded after the main pass, so the results no
+        longer follow the input order.
+        """
+        self.deferred_retries = retries
+        self.retry_budget = budget
+
+    def current_timeout(self):
+        """Time limit for the next GHunt run, in seconds"""
+        if self.retry_deadline is not None:
+            return max(1.0, min(self.ghunt_timeout, self.retry_deadline - time.monotonic()))
+        if self.adaptive_timeout is not None:
+            return self.adaptive_timeout.current()
+        return self.ghunt_timeout
+
+    def enable_metrics(self, path):
+        """Collect run metrics and write them to path when the session closes.
+
+        Paths ending in .prom get the Prometheus textfile format, anything
+        else a JSON summary.
+        """
+        self.metrics = RunMetrics(path)
+
+    def enable_profile(self, path):
+        """Profile the parse and render path with cProfile, saving stats to path"""
+        import cProfile
+        self.profile_path = path
+        self.profiler = cProfile.Profile()
+
+    def _start_profiling(self):
+        """Enable the session profiler for the calling thread's parse/render step.
+
+        cProfile allows one active profiler per process (Python 3.12+), so
+        there is a single profiler and only one worker is profiled at a time;
+        the others run unprofiled instead of waiting. Returns True when the
+        caller must call _stop_profiling(). Never raises: if the profiler
+        can't be enabled, profiling is turned off for the rest of the session.
+        """
+        profiler = self.profiler
+        if profiler is None or not self._profile_lock.acquire(blocking=False):
+            return False
+        try:
+            profiler.enable()
+            return True
+        except Exception as e:
+            self._profile_lock.release()
+            if self.profiler is not None:
+                self.profiler = None
+                print(f"{RGBColors.GOOGLE_YELLOW}⚠ Profiling disabled: {str(e) or type(e).__name__}"
+                      f"{RGBColors.reset()}")
+            return False
+
+    def _stop_profiling(self):
+        """Disable the profiler enabled by _start_profiling()"""
+        try:
+            if self.profiler is not None:
+                self.profiler.disable()
+        finally:
+            self._profile_lock.release()
+
+    def save_profile(self):
+        """Save the parse/render profile as a pstats file"""
+        import pstats
+        if self.profiler is None:
+            return
+        try:
+            self.profiler.create_stats()
+            if not self.profiler.stats:
+                print(f"{RGBColors.GOOGLE_YELLOW}No GHunt output was parsed, profile not saved{RGBColors.reset()}")
+                return
+            pstats.Stats(self.profiler).dump_stats(self.profile_path)
+            print(f"{RGBColors.GOOGLE_GREEN}✓ Parse/render profile saved to: {self.profile_path} "
+                  f"(view with: python3 -m pstats {self.profile_path}){RGBColors.reset()}")
+        except Exception as e:
+            print(f"{RGBColors.GOOGLE_RED}✗ Error saving profile: {str(e)}{RGBColors.reset()}")
+
+    def save_metrics(self):
+        """Write the run metrics file"""
+        try:
+            self.metrics.write()
+            print(f"{RGBColors.GOOGLE_GREEN}✓ Metrics saved to: {self.metrics.path}{RGBColors.reset()}")
+        except Exception as e:
+            print(f"{RGBColors.GOOGLE_RED}✗ Error saving metrics: {str(e)}{RGBColors.reset()}")
+
+    def enable_cache(self, ttl_hours=24, max_entries=50000, refresh=False):
+        """Open the investigation cache in the results folder.
+
+        With refresh=True cached entries are ignored but fresh results are
+        still written back.
+        """
+        try:
+            self.ensure_results_folder()
+            cache_path = os.path.join(self.results_folder, "cache.sqlite3")
+            self.cache = InvestigationCache(cache_path, ttl_hours, max_entries)
+            self.cache_refresh = refresh
+        except Exception as e:
+            print(f"{RGBColors.GOOGLE_RED}✗ Could not open investigation cache: {str(e)}{RGBColors.reset()}")
+            self.cache = None
+
+    def enable_stream(self, pretty=False):
+        """Append results to a JSONL file as each investigation finishes.
+
+        The first line holds the session_info header, every following line is
+        one investigation and a final session_info trailer is written when the
+        run ends. Investigations are not kept in memory in this mode. With
+        pretty=True the usual JSON file is also produced from the stream.
+        """
+        try:
+            self.ensure_results_folder()
+            self.stream_path = os.path.splitext(self.results_file)[0] + ".jsonl"
+            self.stream_file = open(self.stream_path, 'a', encoding='utf-8')
+            self.stream_pretty = pretty
+            self._write_stream_record({"session_info": self.all_results["session_info"]})
+            print(f"{RGBColors.GOOGLE_GREEN}✓ Streaming results to: {os.path.relpath(self.stream_path)}{RGBColors.reset()}")
+        except Exception as e:
+            print(f"{RGBColors.GOOGLE_RED}✗ Could not open results stream: {str(e)}{RGBColors.reset()}")
+            self.stream_file = None
+
+    def enable_checkpoint(self, resume_from=None, retry_failed=False):
+        """Start recording batch progress and return the emails to skip.
+
+        The checkpoint is a small JSONL file of {"email", "status"} lines
+        next to the results file. When resuming, the checkpoint belonging to
+        resume_from (or the results file itself) is loaded and appended to,
+        so a run can be resumed any number of times.
+
+        A checkpointed email must not be lost when the run is interrupted,
+        so batch results are streamed to disk (see enable_stream); the usual
+        JSON file is still written from the stream at the end. Without a
+        stream no checkpoint is recorded.
         """
+        completed = set()
+        if self.stream_file is None:
+            self.enable_stream(pretty=True)
+        self.ensure_results_folder()
+        self.checkpoint_path = os.path.splitext(self.results_file)[0] + ".checkpoint"
+        if resume_from:
+            base = resume_from
+            if not base.endswith(".checkpoint"):
+                base = os.path.splitext(resume_from)[0] + ".checkpoint"
+            source = base if os.path.exists(base) else resume_from
+            statuses = load_checkpoint(source)
+            for email, status in statuses.items():
+                if not (retry_failed and status in RETRYABLE_STATUSES):
+                    completed.add(email)
+            self.checkpoint_path = base
+            self.all_results["session_info"]["resumed_from"] = os.path.relpath(resume_from)
+            print(f"{RGBColors.GOOGLE_GREEN}✓ Loaded checkpoint: {len(statuses)} email(s) already finished, "
+                  f"{len(completed)} will be skipped{RGBColors.reset()}")
+        if self.stream_file is None:
+            print(f"{RGBColors.GOOGLE_YELLOW}⚠ Progress is not checkpointed without a results stream"
+                  f"{RGBColors.reset()}")
+            return completed
         try:
-            gb.rc.print(banner)
-        except Exception:
-            # Fallback to basic print
-            print("GoOsint - Gmail OSINT Tool powered by GHunt")
-    else:
-        print("GoOsint - Gmail OSINT Tool powered by GHunt")
+            self.checkpoint_file = open(self.checkpoint_path, 'a', encoding='utf-8')
+        except Exception as e:
+            print(f"{RGBColors.GOOGLE_RED}✗ Could not open checkpoint file: {str(e)}{RGBColors.reset()}")
+            self.checkpoint_file = None
+        return completed
 
-class GoOsint:
-    def __init__(self):
-        # Rich console banner in GHunt style
-        self.rich_banner = """
+    def _write_stream_record(self, record):
+        """Append one JSON record to the results stream and flush it to disk"""
+        self.stream_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream_file.flush()
+
+    def record_investigation(self, investigation_data):
+        """Store a finished investigation in the session results"""
+        started = time.perf_counter()
+        self.all_results["session_info"]["total_investigations"] += 1
+        record = investigation_data
+        if self.diff_baseline is not None:
+            record = diff_investigation(self.diff_baseline.get(investigation_data.get("email", "")),
+                                        investigation_data)
+            change = record.get("change", record.get("status"))
+            self.diff_counts[change] = self.diff_counts.get(change, 0) + 1
+        self._store_raw_output(record)
+        if self.stream_file is not None:
+            self._write_stream_record(record)
+        else:
+            self.all_results["investigations"].append(record)
+        # Only checkpointed once the record itself is on disk
+        if self.checkpoint_file is not None:
+            self.checkpoint_file.write(json.dumps({"email": record.get("email"),
+                                                   "status": record.get("status")}) + "\n")
+            self.checkpoint_file.flush()
+        if self.record_output is not None:
+            compact = {key: value for key, value in record.items() if key != "raw_output"}
+            self.record_output.write(json.dumps(compact, ensure_ascii=False, separators=(",", ":")) + "\n")
+            self.record_output.flush()
+        if self.metrics is not None:
+            # The record is already written, so its own "persist" timing only
+            # covers the cache; the checkpoint and stream writes count here
+            persist = investigation_data.get("timings", {}).get("persist", 0.0)
+            self.metrics.observe(investigation_data)
+            self.metrics.observe_stage("persist", persist + time.perf_counter() - started)
+
+    @property
+    def rich_banner(self):
+        """Rich console banner in GHunt style"""
+        return """
     [blue] ██████╗  ██████╗ [/][blue] ██████╗ ███████╗██╗███╗   ██╗████████╗[/]
     [blue]██╔════╝ ██╔═══██╗[/][blue]██╔═══██╗██╔════╝██║████╗  ██║╚══██╔══╝[/]
     [blue]██║  ███╗██║   ██║[/][blue]██║   ██║███████╗██║██╔██╗ ██║   ██║   [/]
@@ -78,9 +2432,11 @@ class GoOsint:
              [cyan]Version 1.0 | Author: 7wh0Am-i[/cyan]
         [yellow]⚠️  For Educational and Legal OSINT purposes only ⚠️[/yellow]
     """
-        
-        # Fallback banner for when GHunt is not available
-        self.fallback_banner = f"""
+
+    @property
+    def fallback_banner(self):
+        """Fallback banner for when GHunt is not available"""
+        return f"""
 {RGBColors.GOOGLE_BLUE}
  ██████╗  ██████╗ {RGBColors.GOOGLE_BLUE}██████╗ ███████╗██╗███╗   ██╗████████╗
 {RGBColors.GOOGLE_BLUE}██╔════╝ ██╔═══██╗{RGBColors.GOOGLE_BLUE}██╔═══██╗██╔════╝██║████╗  ██║╚══██╔══╝
@@ -94,21 +2450,12 @@ class GoOsint:
 {RGBColors.WHITE}        ⚠️  For Educational and Legal OSINT purposes only ⚠️{RGBColors.reset()}
 {RGBColors.GOOGLE_BLUE}═══════════════════════════════════════════════════════════{RGBColors.reset()}
 """
-        # Initialize results storage
-        self.results_folder = "results"
-        self.ensure_results_folder()
-        self.results_file = os.path.join(self.results_folder, f"investigation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-        self.all_results = {
-            "session_info": {
-                "start_time": datetime.now().isoformat(),
-                "tool_version": "1.0",
-                "total_investigations": 0
-            },
-            "investigations": []
-        }
 
     def ensure_results_folder(self):
         """Create results folder if it doesn't exist"""
+        if self.results_folder_ready:
+            return
+        self.results_folder_ready = True
         try:
             if not os.path.exists(self.results_folder):
                 os.makedirs(self.results_folder)
@@ -117,12 +2464,13 @@ class GoOsint:
             print(f"{RGBColors.GOOGLE_RED}✗ Error creating results folder: {str(e)}{RGBColors.reset()}")
             # Fallback to current directory
             self.results_folder = "."
+            self.results_file = os.path.join(self.results_folder, os.path.basename(self.results_file))
 
     def print_banner(self):
         """Display the GoOsint banner using GHunt's rich console if available"""
         if GHUNT_AVAILABLE:
             try:
-                gb.rc.print(self.rich_banner)
+                rich_console().print(self.rich_banner)
             except Exception:
                 # If rich console fails, fallback to regular banner
                 print(self.fallback_banner)
@@ -131,84 +2479,50 @@ class GoOsint:
 
     def parse_ghunt_output(self, output_lines, email):
         """Parse GHunt output into structured JSON data"""
-        investigation_data = {
-            "email": email,
-            "timestamp": datetime.now().isoformat(),
-            "status": "success",
-            "google_account": {},
-            "services": {},
-            "profile": {},
-            "raw_output": output_lines
-        }
-        
-        current_section = None
-        
+        parser = GHuntOutputParser(email)
         for line in output_lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Parse different sections
-            if "🙋 Google Account data" in line:
-                current_section = "google_account"
-            elif "📞 Google Chat Extended Data" in line:
-                current_section = "google_chat"
-            elif "🌐 Google Plus Extended Data" in line:
-                current_section = "google_plus"
-            elif "🎮 Play Games data" in line:
-                current_section = "play_games"
-            elif "🗺️ Maps data" in line:
-                current_section = "maps"
-            elif "🗓️ Calendar data" in line:
-                current_section = "calendar"
-            elif "🎵 YouTube data" in line:
-                current_section = "youtube"
-            
-            # Extract specific information
-            if "Email :" in line:
-                investigation_data["profile"]["email"] = line.split("Email :")[1].strip()
-            elif "Gaia ID :" in line:
-                investigation_data["profile"]["gaia_id"] = line.split("Gaia ID :")[1].strip()
-            elif "Last profile edit :" in line:
-                investigation_data["profile"]["last_edit"] = line.split("Last profile edit :")[1].strip()
-            elif line.startswith("=> https://"):
-                if "profile" not in investigation_data["profile"]:
-                    investigation_data["profile"]["profile_picture"] = line.replace("=> ", "")
-            elif "Profile page :" in line:
-                investigation_data["services"]["maps_profile"] = line.split("Profile page :")[1].strip()
-            elif "Entity Type :" in line:
-                investigation_data["services"]["chat_entity_type"] = line.split("Entity Type :")[1].strip()
-            elif "Customer ID :" in line:
-                investigation_data["services"]["chat_customer_id"] = line.split("Customer ID :")[1].strip()
-            elif "Entreprise User :" in line:
-                investigation_data["services"]["enterprise_user"] = line.split("Entreprise User :")[1].strip()
-            elif line.startswith("[+]") and "Activated Google services" in line:
-                investigation_data["services"]["activated_services"] = []
-            elif line.startswith("- ") and current_section in ["google_plus"]:
-                if "activated_services" not in investigation_data["services"]:
-                    investigation_data["services"]["activated_services"] = []
-                investigation_data["services"]["activated_services"].append(line[2:])
-            elif "Reviews :" in line:
-                investigation_data["services"]["maps_reviews"] = line.split("Reviews :")[1].strip()
-            elif "Photos :" in line:
-                investigation_data["services"]["maps_photos"] = line.split("Photos :")[1].strip()
-            elif "Answers :" in line:
-                investigation_data["services"]["maps_answers"] = line.split("Answers :")[1].strip()
-                
-        return investigation_data
+            parser.feed(line)
+        return parser.data
 
     def save_results_to_json(self):
         """Save all results to a single JSON file"""
         try:
             self.all_results["session_info"]["end_time"] = datetime.now().isoformat()
-            self.all_results["session_info"]["total_investigations"] = len(self.all_results["investigations"])
+            if self.cache is not None:
+                self.all_results["session_info"]["cache"] = self.cache.stats()
+            if self.rate_limiter is not None:
+                self.all_results["session_info"]["rate_limit"] = self.rate_limiter.stats()
+            if self.credential_pool is not None:
+                self.all_results["session_info"]["credential_profiles"] = self.credential_pool.stats()
+            if self.raw_store is not None:
+                self.all_results["session_info"]["raw_output"] = self.raw_store.stats()
+            elif self.raw_output_mode == "none":
+                self.all_results["session_info"]["raw_output"] = {"mode": "none"}
+            if self.diff_baseline is not None:
+                self.all_results["session_info"]["changes"] = dict(self.diff_counts)
+
+            if self.stream_file is not None:
+                # Results are already on disk, just close the stream with the trailer
+                self._write_stream_record({"session_info": self.all_results["session_info"]})
+                self.stream_file.close()
+                self.stream_file = None
+                print(f"{RGBColors.GOOGLE_GREEN}✓ All results streamed to: {os.path.relpath(self.stream_path)}{RGBColors.reset()}")
+                if not self.stream_pretty:
+                    self._index_saved_results(self.stream_path)
+                    return True
+                converted = convert_stream_to_json(self.stream_path, self.results_file)
+                if converted:
+                    self._index_saved_results(self.results_file)
+                return converted
             
+            self.ensure_results_folder()
             with open(self.results_file, 'w', encoding='utf-8') as f:
                 json.dump(self.all_results, f, indent=2, ensure_ascii=False)
             
             # Show relative path for cleaner output
             relative_path = os.path.relpath(self.results_file)
             print(f"{RGBColors.GOOGLE_GREEN}✓ All results saved to: {relative_path}{RGBColors.reset()}")
+            self._index_saved_results(self.results_file)
             return True
         except Exception as e:
             print(f"{RGBColors.GOOGLE_RED}✗ Error saving results: {str(e)}{RGBColors.reset()}")
@@ -216,19 +2530,12 @@ class GoOsint:
 
     def check_ghunt_installation(self):
         """Check if GHunt is installed and available"""
-        try:
-            # Check if ghunt command exists without showing banner
-            result = subprocess.run(['which', 'ghunt'], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                print(f"{RGBColors.GOOGLE_GREEN}✓ GHunt is installed and ready{RGBColors.reset()}")
-                return True
-            else:
-                print(f"{RGBColors.GOOGLE_RED}✗ GHunt not found{RGBColors.reset()}")
-                return False
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            print(f"{RGBColors.GOOGLE_RED}✗ GHunt is not installed{RGBColors.reset()}")
-            return False
+        # Look the ghunt command up on PATH in-process, without starting GHunt
+        if shutil.which('ghunt'):
+            print(f"{RGBColors.GOOGLE_GREEN}✓ GHunt is installed and ready{RGBColors.reset()}")
+            return True
+        print(f"{RGBColors.GOOGLE_RED}✗ GHunt not found{RGBColors.reset()}")
+        return False
 
     def install_ghunt(self):
         """Install GHunt using pip"""
@@ -246,73 +2553,341 @@ class GoOsint:
             print(f"{RGBColors.GOOGLE_RED}✗ Error installing GHunt: {str(e)}{RGBColors.reset()}")
             return False
 
-    def email_investigation(self, email):
-        """Perform email investigation using GHunt"""
-        print(f"\n{RGBColors.LIGHT_BLUE}🔍 Investigating email: {email}{RGBColors.reset()}")
-        print(f"{RGBColors.GOOGLE_YELLOW}{'='*60}{RGBColors.reset()}")
-        
+    def investigate_email(self, email):
+        """Run GHunt for a single email and return (investigation_data, output).
+
+        Nothing is stored here so this can run in worker threads; the
+        colorized console output is returned as one string instead, so it
+        can be written in one go. In quiet mode the output is empty.
+        """
+        import sqlite3
+        started = time.perf_counter()
+        out = ConsoleBuffer(self.quiet)
+        out.append(f"\n{RGBColors.LIGHT_BLUE}🔍 Investigating email: {email}{RGBColors.reset()}")
+        out.append(f"{RGBColors.GOOGLE_YELLOW}{'='*60}{RGBColors.reset()}")
+
+        cache = self.cache
+        if cache is not None and not self.cache_refresh:
+            try:
+                cached = cache.get(email)
+            except sqlite3.Error as e:
+                self._disable_cache(cache, e)
+                cached = None
+            if cached is not None:
+                cached["cache_hit"] = True
+                out.append(f"{RGBColors.GOOGLE_GREEN}✓ Using cached result from {cached.get('timestamp', 'unknown')}{RGBColors.reset()}")
+                if cached.get("status") == "success":
+                    if not out.quiet:
+                        out.extend(self.render_ghunt_output(cached.get("raw_output", [])))
+                else:
+                    out.append(f"{RGBColors.GOOGLE_YELLOW}No detailed information found for this email{RGBColors.reset()}")
+                out.append("")
+                cached["timings"] = {}
+                cached["duration_seconds"] = round(time.perf_counter() - started, 4)
+                return cached, out.getvalue()
+
+        investigation_data = self._run_ghunt_paced(email, out)
+        timings = investigation_data.setdefault("timings", {})
+        if cache is not None and self.cache is cache:
+            persist_started = time.perf_counter()
+            try:
+                cache.put(email, investigation_data)
+            except sqlite3.Error as e:
+                self._disable_cache(cache, e)
+            timings["persist"] = time.perf_counter() - persist_started
+        for stage, seconds in timings.items():
+            timings[stage] = round(seconds, 6)
+        investigation_data["duration_seconds"] = round(time.perf_counter() - started, 4)
+        return investigation_data, out.getvalue()
+
+    def _disable_cache(self, cache, error):
+        """Carry on without the cache after a database error (e.g. locked by another shard)"""
+        import sqlite3
+        with self._cache_lock:
+            if self.cache is not cache:
+                return
+            self.cache = None
+        print(f"{RGBColors.GOOGLE_YELLOW}⚠ Investigation cache disabled after an error: {str(error)}{RGBColors.reset()}")
         try:
-            # Run GHunt email investigation with output capture to hide banner
-            result = subprocess.run(['ghunt', 'email', email], 
-                                  capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0:
-                # Filter out the GHunt banner and keep only the investigation results
-                output_lines = result.stdout.split('\n')
-                filtered_output = []
-                skip_banner = True
-                
-                for line in output_lines:
-                    # Skip lines until we find actual investigation content
-                    if skip_banner:
-                        if ('Target' in line or 'Name' in line or 'Email' in line or 
-                            'Google ID' in line or '[+]' in line or '[-]' in line or
-                            'Profile' in line or 'YouTube' in line or 'Photos' in line):
-                            skip_banner = False
-                            filtered_output.append(line)
-                    else:
-                        filtered_output.append(line)
-                
-                # Display filtered results with colors
-                if filtered_output:
-                    print(f"{RGBColors.GOOGLE_GREEN}Investigation Results:{RGBColors.reset()}")
-                    print()  # Add gap after header
-                    
-                    section_headers = ['🙋', '📞', '🌐', '🎮', '🗺️', '🗓️', '🎵', '📱', '🔍']
-                    
-                    for line in filtered_output:
-                        if line.strip():
-                            # Add gap before section headers (emoji-based sections)
-                            if any(header in line for header in section_headers):
-                                print()  # Gap before new section
-                            
-                            # Colorize different types of output
-                            if line.startswith('[+]'):
-                                print(f"{RGBColors.GOOGLE_GREEN}{line}{RGBColors.reset()}")
-                            elif line.startswith('[-]'):
-                                print(f"{RGBColors.GOOGLE_RED}{line}{RGBColors.reset()}")
-                            elif line.startswith('[!]'):
-                                print(f"{RGBColors.GOOGLE_YELLOW}{line}{RGBColors.reset()}")
-                            elif 'Name:' in line or 'Email:' in line or 'Google ID:' in line:
-                                print(f"{RGBColors.LIGHT_BLUE}{line}{RGBColors.reset()}")
-                            elif any(header in line for header in section_headers):
-                                print(f"{RGBColors.GOOGLE_BLUE}{line}{RGBColors.reset()}")  # Section headers in blue
-                            else:
-                                print(line)
-                            
-                            # Add gap after certain result types for better readability
-                            if (line.startswith('=>') or 
-                                'Profile page :' in line or 
-                                'Last profile edit :' in line or
-                                'User types :' in line):
-                                print()  # Gap after important info
-                    
-                    # Parse and store results in JSON format
-                    investigation_data = self.parse_ghunt_output(filtered_output, email)
-                    self.all_results["investigations"].append(investigation_data)
-                                
+            cache.close()
+        except sqlite3.Error:
+            pass
+
+    def _run_ghunt_paced(self, email, out):
+        """Run GHunt through the rate limiter, retrying throttled attempts"""
+        limiter = self.rate_limiter
+        if limiter is None:
+            return self._run_ghunt(email, out)
+
+        attempt = 0
+        timings = {}
+        while True:
+            limiter.acquire()
+            investigation_data = self._run_ghunt(email, out)
+            # Throttled attempts count towards the stage timings too
+            for stage, seconds in investigation_data.get("timings", {}).items():
+                timings[stage] = timings.get(stage, 0.0) + seconds
+            investigation_data["timings"] = timings
+            signature = rate_limit_signature(investigation_data)
+            if signature is None and self.credential_pool is not None:
+                signature = auth_error_signature(investigation_data)
+            if signature is None:
+                limiter.on_success()
+                break
+            # With a credential pool only the profile cools down (see CredentialPool.release)
+            cooldown = None if self.credential_pool is not None else limiter.on_throttle(email, signature)
+            retryable = investigation_data.get("status") in RETRYABLE_STATUSES
+            if not retryable or attempt >= limiter.max_retries:
+                investigation_data["throttled"] = True
+                break
+            attempt += 1
+            limiter.on_retry()
+            if cooldown is None:
+                out.append(f"{RGBColors.GOOGLE_YELLOW}⏳ Profile {investigation_data.get('credential_profile')} "
+                           f"rejected ({signature}), retrying with another credential profile "
+                           f"(attempt {attempt + 1}/{limiter.max_retries + 1}){RGBColors.reset()}")
+            else:
+                out.append(f"{RGBColors.GOOGLE_YELLOW}⏳ Rate limited ({signature}), retrying in "
+                           f"{cooldown:.0f}s (attempt {attempt + 1}/{limiter.max_retries + 1}){RGBColors.reset()}")
+        if attempt:
+            investigation_data["rate_limit_retries"] = attempt
+        return investigation_data
+
+    def render_ghunt_output(self, filtered_output):
+        """Colorize filtered GHunt output lines for the console"""
+        out = self.render_results_header()
+        for line in filtered_output:
+            out.extend(self.render_ghunt_line(line, classify_ghunt_line(line)))
+        return out
+
+    def render_results_header(self):
+        """Lines shown once before an investigation's results"""
+        return [f"{RGBColors.GOOGLE_GREEN}Investigation Results:{RGBColors.reset()}", ""]
+
+    def render_ghunt_line(self, line, info=None):
+        """Colorize one line of GHunt output, returning the console lines to show"""
+        if info is None:
+            info = classify_ghunt_line(line)
+        if info.kind == "blank":
+            return []
+
+        out = []
+        # Add gap before section headers (emoji-based sections)
+        if info.gap_before:
+            out.append("")
+        color = LINE_COLORS.get(info.kind)
+        out.append(f"{color}{line}{RGBColors.reset()}" if color else line)
+        # Add gap after certain result types for better readability
+        if info.gap_after:
+            out.append("")
+        return out
+
+    def _run_ghunt(self, email, out):
+        """Investigate email with the active backend, appending console output to out"""
+        if self.engine_pending is not None:
+            with self._engine_lock:
+                if self.engine_pending is not None:
+                    self.enable_library_backend(required=self.engine_pending == "required")
+                    self.engine_pending = None
+        pool = self.credential_pool
+        profile = pool.acquire() if pool is not None else None
+        investigation_data = None
+        started = time.perf_counter()
+        try:
+            if profile is not None and self.profile_engines:
+                investigation_data = self._run_ghunt_profile_library(email, out, profile)
+            elif self.engine is not None:
+                investigation_data = self._run_ghunt_library(email, out)
+            # None when the library backend just gave up on this email
+            if investigation_data is None:
+                investigation_data = self._run_ghunt_subprocess(email, out, profile)
+        finally:
+            if profile is not None:
+                pool.release(profile, investigation_data, time.perf_counter() - started)
+        if profile is not None:
+            investigation_data["credential_profile"] = profile.name
+        if self.adaptive_timeout is not None and investigation_data.get("status") in ("success", "no_data"):
+            self.adaptive_timeout.observe(time.perf_counter() - started)
+        return investigation_data
+
+    def _run_ghunt_profile_library(self, email, out, profile):
+        """Investigate email with the in-process engine of a credential profile"""
+        try:
+            engine = self.credential_pool.engine_for(profile)
+        except Exception as e:
+            error = f"GHunt session unavailable for credential profile {profile.name}: {str(e) or type(e).__name__}"
+            out.append(f"{RGBColors.GOOGLE_RED}✗ {error}{RGBColors.reset()}")
+            return {"email": email, "timestamp": datetime.now().isoformat(), "status": "error",
+                    "error": error, "timings": {}}
+        return self._run_ghunt_library(email, out, engine)
+
+    def _run_ghunt_library(self, email, out, engine=None):
+        """Investigate email with the in-process GHunt engine (by default the shared one)"""
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+        engine = engine if engine is not None else self.engine
+        timings = {"ghunt": 0.0, "render": 0.0}
+        timeout = round(self.current_timeout(), 1)
+        started = time.perf_counter()
+        try:
+            found, profile, services, output_lines = engine.lookup(email, timeout=timeout)
+            timings["ghunt"] = time.perf_counter() - started
+            if found and not out.quiet:
+                render_started = time.perf_counter()
+                profiling = self._start_profiling()
+                try:
+                    out.extend(self.render_ghunt_output(output_lines))
+                finally:
+                    if profiling:
+                        self._stop_profiling()
+                timings["render"] = time.perf_counter() - render_started
+            if found:
+                investigation_data = {
+                    "email": email,
+                    "timestamp": datetime.now().isoformat(),
+                    "status": "success",
+                    "google_account": {},
+                    "services": services,
+                    "profile": profile,
+                    "raw_output": output_lines
+                }
+            else:
+                out.append(f"{RGBColors.GOOGLE_YELLOW}No detailed information found for this email{RGBColors.reset()}")
+                investigation_data = {
+                    "email": email,
+                    "timestamp": datetime.now().isoformat(),
+                    "status": "no_data",
+                    "message": "No detailed information found"
+                }
+            out.append("")  # Add gap after results
+        except FutureTimeoutError:
+            out.append(f"{RGBColors.GOOGLE_RED}✗ Investigation timed out{RGBColors.reset()}")
+            investigation_data = {
+                "email": email,
+                "timestamp": datetime.now().isoformat(),
+                "status": "timeout",
+                "error": f"Investigation timed out after {timeout:g} seconds"
+            }
+        except Exception as e:
+            if not is_network_error(e):
+                # Most likely GHunt's API changed under the engine: use the ghunt command instead
+                self._disable_library_backend(e)
+                return None
+            out.append(f"{RGBColors.GOOGLE_RED}✗ Error during investigation: {str(e)}{RGBColors.reset()}")
+            investigation_data = {
+                "email": email,
+                "timestamp": datetime.now().isoformat(),
+                "status": "error",
+                "error": str(e)
+            }
+        if not timings["ghunt"]:
+            timings["ghunt"] = time.perf_counter() - started
+        investigation_data["timings"] = timings
+        return investigation_data
+
+    def _disable_library_backend(self, error):
+        """Switch the rest of the run to the ghunt command after an unexpected engine error"""
+        with self._engine_lock:
+            if self.engine is None and not self.profile_engines:
+                return
+            # Other workers may still be inside a lookup, so the engine is closed with the session
+            if self.engine is not None:
+                self._retired_engines.append(self.engine)
+                self.engine = None
+            self.profile_engines = False
+        print(f"{RGBColors.GOOGLE_YELLOW}⚠ In-process GHunt engine failed ({type(error).__name__}: {str(error)}), "
+              f"using the ghunt command for the rest of the run{RGBColors.reset()}")
+
+    def _run_ghunt_subprocess(self, email, out, profile=None):
+        """Run the GHunt subprocess for email, appending console output to out
+
+        GHunt's stdout is read line by line: banner skipping, rendering and
+        parsing happen as lines arrive, and a run that times out keeps the
+        data it produced so far. With a credential profile, GHunt is given
+        the profile's home directory so it loads that credentials file.
+        """
+        process = None
+        timer = None
+        timed_out = threading.Event()
+        parser = GHuntOutputParser(email)
+        clock = time.perf_counter
+        timings = dict.fromkeys(("spawn", "ghunt", "banner_filter", "parse", "render"), 0.0)
+        render = not out.quiet
+        timeout = round(self.current_timeout(), 1)
+        env = dict(os.environ, PYTHONUNBUFFERED="1")
+        if profile is not None:
+            env.update(profile_environment(profile.home))
+        started = clock()
+        try:
+            # Run GHunt unbuffered so its results reach us as they are printed
+            process = subprocess.Popen(['ghunt', 'email', email],
+                                       stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                       env=env)
+            spawned = clock()
+            timings["spawn"] = spawned - started
+
+            def kill_on_timeout():
+                timed_out.set()
+                process.kill()
+
+            timer = threading.Timer(timeout, kill_on_timeout)
+            timer.daemon = True
+            timer.start()
+
+            # Drain stderr in the background so a chatty child can't block on it
+            stderr_chunks = []
+            stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()),
+                                             daemon=True)
+            stderr_reader.start()
+
+            # Skip GHunt's banner, then render and parse every line as it arrives
+            skip_banner = True
+            for line in process.stdout:
+                line = line.rstrip('\n')
+                if skip_banner:
+                    filter_started = clock()
+                    is_content = is_ghunt_content_line(line)
+                    timings["banner_filter"] += clock() - filter_started
+                    if not is_content:
+                        continue
+                    skip_banner = False
+                    if render:
+                        out.extend(self.render_results_header())
+                profiling = self._start_profiling()
+                try:
+                    render_started = clock()
+                    info = classify_ghunt_line(line)
+                    if render:
+                        out.extend(self.render_ghunt_line(line, info))
+                    parse_started = clock()
+                    parser.feed(line, info)
+                    parse_done = clock()
+                finally:
+                    if profiling:
+                        self._stop_profiling()
+                # Classification is shared by both, it is counted as rendering
+                # (in quiet mode it is all that is left of it)
+                timings["render"] += parse_started - render_started
+                timings["parse"] += parse_done - parse_started
+
+            returncode = process.wait()
+            timings["ghunt"] = clock() - spawned
+            timer.cancel()
+            stderr_reader.join()
+            error_output = "".join(stderr_chunks).strip()
+
+            if timed_out.is_set():
+                out.append(f"{RGBColors.GOOGLE_RED}✗ Investigation timed out{RGBColors.reset()}")
+                # Store timeout in JSON, keeping whatever GHunt printed before it
+                investigation_data = parser.data
+                investigation_data["status"] = "timeout"
+                investigation_data["error"] = f"Investigation timed out after {timeout:g} seconds"
+                investigation_data["partial"] = bool(investigation_data["raw_output"])
+
+            elif returncode == 0:
+                if not skip_banner:
+                    investigation_data = parser.data
                 else:
-                    print(f"{RGBColors.GOOGLE_YELLOW}No detailed information found for this email{RGBColors.reset()}")
+                    out.append(f"{RGBColors.GOOGLE_YELLOW}No detailed information found for this email{RGBColors.reset()}")
                     # Store failed investigation
                     investigation_data = {
                         "email": email,
@@ -320,17 +2895,15 @@ class GoOsint:
                         "status": "no_data",
                         "message": "No detailed information found"
                     }
-                    self.all_results["investigations"].append(investigation_data)
                 
-                print()  # Add gap after results
+                out.append("")  # Add gap after results
                 
             else:
                 # Handle error output with colors
-                error_output = result.stderr.strip()
                 if error_output:
-                    print(f"{RGBColors.GOOGLE_RED}✗ Investigation failed: {error_output}{RGBColors.reset()}")
+                    out.append(f"{RGBColors.GOOGLE_RED}✗ Investigation failed: {error_output}{RGBColors.reset()}")
                 else:
-                    print(f"{RGBColors.GOOGLE_RED}✗ Investigation failed with no error details{RGBColors.reset()}")
+                    out.append(f"{RGBColors.GOOGLE_RED}✗ Investigation failed with no error details{RGBColors.reset()}")
                 
                 # Store failed investigation in JSON
                 investigation_data = {
@@ -339,20 +2912,9 @@ class GoOsint:
                     "status": "failed",
                     "error": error_output if error_output else "No error details"
                 }
-                self.all_results["investigations"].append(investigation_data)
                 
-        except subprocess.TimeoutExpired:
-            print(f"{RGBColors.GOOGLE_RED}✗ Investigation timed out{RGBColors.reset()}")
-            # Store timeout in JSON
-            investigation_data = {
-                "email": email,
-                "timestamp": datetime.now().isoformat(),
-                "status": "timeout",
-                "error": "Investigation timed out after 60 seconds"
-            }
-            self.all_results["investigations"].append(investigation_data)
         except Exception as e:
-            print(f"{RGBColors.GOOGLE_RED}✗ Error during investigation: {str(e)}{RGBColors.reset()}")
+            out.append(f"{RGBColors.GOOGLE_RED}✗ Error during investigation: {str(e)}{RGBColors.reset()}")
             # Store exception in JSON
             investigation_data = {
                 "email": email,
@@ -360,57 +2922,439 @@ class GoOsint:
                 "status": "error",
                 "error": str(e)
             }
-            self.all_results["investigations"].append(investigation_data)
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if process is not None and process.poll() is None:
+                process.kill()
+                process.wait()
+
+        investigation_data["timings"] = timings
+        return investigation_data
+
+    def serve(self, address, workers=1):
+        """Investigate emails submitted by local clients until interrupted.
+
+        Results are streamed to a JSONL file as jobs finish so a long-running
+        server doesn't keep them in memory, and GHunt output isn't rendered.
+        """
+        if not self.quiet:
+            self.enable_quiet()
+        if self.stream_file is None:
+            self.enable_stream()
+        import signal
+        server = InvestigationServer(self, workers)
+
+        def stop(signum, frame):
+            print(f"\n{RGBColors.GOOGLE_YELLOW}Stopping server...{RGBColors.reset()}")
+            server.shutdown()
+
+        # Service managers stop us with SIGTERM; shut down like on Ctrl-C so the stream is closed
+        previous = None
+        if threading.current_thread() is threading.main_thread():
+            previous = signal.signal(signal.SIGTERM, stop)
+        try:
+            server.serve(address)
+        except KeyboardInterrupt:
+            print(f"\n{RGBColors.GOOGLE_YELLOW}Stopping server...{RGBColors.reset()}")
+        except OSError as e:
+            print(f"{RGBColors.GOOGLE_RED}✗ Could not serve on {address}: {str(e)}{RGBColors.reset()}")
+        finally:
+            if previous is not None:
+                signal.signal(signal.SIGTERM, previous)
+        self.save_results_to_json()
+
+    def email_investigation(self, email):
+        """Perform email investigation using GHunt"""
+        investigation_data, output = self.investigate_email(email)
+        if output:
+            print(output)
+        self.record_investigation(investigation_data)
+        return investigation_data
+
+    def iter_investigations(self, emails, workers=1, announce=None):
+        """Yield (email, investigation_data, output) in input order.
+
+        Each email's console output is yielded as one block. With more than
+        one worker, up to `workers` GHunt runs are kept in flight on a thread
+        pool. Only a small window of futures is queued ahead of the consumer
+        so long lists don't pile up in memory. announce(email) is called
+        right before an email's output is shown.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        if announce is None:
+            announce = lambda email: None
+
+        if workers <= 1:
+            for email in emails:
+                announce(email)
+                yield (email,) + self.investigate_email(email)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for email in emails:
+                pending.append((email, executor.submit(self.investigate_email, email)))
+                if len(pending) >= workers * 2:
+                    email_done, future = pending.popleft()
+                    announce(email_done)
+                    yield (email_done,) + future.result()
+            while pending:
+                email_done, future = pending.popleft()
+                announce(email_done)
+                yield (email_done,) + future.result()
+
+    def iter_scheduled(self, scheduler, workers=1, announce=None):
+        """Yield (email, investigation_data, output) as investigations finish.
+
+        `workers` threads each take the most urgent waiting email from the
+        scheduler, so emails added during the batch are started by the next
+        free worker. Every investigation gets a "schedule" entry (priority,
+        deadline and queueing times). announce(email, item) is called right
+        before an email's output is shown.
+        """
+        import queue
+
+        if announce is None:
+            announce = lambda email, item=None: None
+        results = queue.Queue()
+
+        def work():
+            try:
+                while True:
+                    item = scheduler.next_email()
+                    if item is None:
+                        return
+                    started = time.monotonic()
+                    try:
+                        investigation_data, output = self.investigate_email(item.email)
+                    except Exception as e:
+                        # Keep the email in the results, checkpoint and retry queue
+                        investigation_data = {"email": item.email, "timestamp": datetime.now().isoformat(),
+                                              "status": "error", "error": str(e)}
+                        output = f"{RGBColors.GOOGLE_RED}✗ Error during investigation of {item.email}: {str(e)}{RGBColors.reset()}"
+                    schedule = scheduler.finish(item, started)
+                    investigation_data["schedule"] = schedule
+                    results.put((item, investigation_data, output))
+            finally:
+                results.put(None)
+
+        threads = [threading.Thread(target=work, daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        remaining = len(threads)
+        try:
+            while remaining:
+                result = results.get()
+                if result is None:
+                    remaining -= 1
+                    continue
+                item, investigation_data, output = result
+                announce(item.email, item)
+                yield item.email, investigation_data, output
+        finally:
+            scheduler.close()
+
+    def print_profile_summary(self, stats):
+        """Show how each credential profile fared"""
+        for name, counts in stats.items():
+            latency = counts["latency_p50_seconds"]
+            color = RGBColors.GOOGLE_YELLOW if counts["cooldowns"] else RGBColors.GOOGLE_GREEN
+            print(f"{color}Profile {name}: {counts['calls']} run(s), {counts['success']} found, "
+                  f"{counts['rate_limited']} rate limited, {counts['auth_errors']} auth error(s), "
+                  f"p50 {latency if latency is not None else 0:.1f}s{RGBColors.reset()}")
+
+    def print_schedule_summary(self, stats):
+        """Show per-priority turnaround times of a scheduled batch"""
+        if stats["dropped"] or stats["drop_file"]:
+            print(f"{RGBColors.GOOGLE_GREEN}Drop file added {stats['dropped']} email(s), moved up "
+                  f"{stats['raised']}{RGBColors.reset()}")
+        for priority, latency in stats["priorities"].items():
+            missed = ""
+            if latency["deadlines"]:
+                missed = f", {latency['deadlines_missed']}/{latency['deadlines']} deadline(s) missed"
+            color = RGBColors.GOOGLE_YELLOW if latency["deadlines_missed"] else RGBColors.GOOGLE_GREEN
+            print(f"{color}Priority {priority}: {latency['investigations']} email(s), turnaround "
+                  f"p50 {latency['turnaround_p50_seconds']:.1f}s, p95 {latency['turnaround_p95_seconds']:.1f}s"
+                  f"{missed}{RGBColors.reset()}")
+
+    def batch_investigation(self, email_file, workers=1, resume_from=None, retry_failed=False, column=None):
+        """Perform batch investigation from email list file
 
-    def batch_investigation(self, email_file):
-        """Perform batch investigation from email list file"""
-        if not os.path.exists(email_file):
+        The list is read lazily (see read_email_list) and addresses are
+        normalized and deduplicated on the fly, so huge lists and stdin
+        ("-") work in bounded memory. Progress is checkpointed as results
+        come in; pass resume_from (a previous results or checkpoint file) to
+        skip emails that already finished, and retry_failed to re-run only
+        failures and timeouts. With enable_scheduling the list is loaded
+        into a BatchScheduler and run most urgent first instead.
+        """
+        if email_file != "-" and not os.path.exists(email_file):
             print(f"{RGBColors.GOOGLE_RED}✗ Email list file not found: {email_file}{RGBColors.reset()}")
             return
         
-        print(f"\n{RGBColors.LIGHT_BLUE}📋 Starting batch investigation from: {email_file}{RGBColors.reset()}")
+        source = "stdin" if email_file == "-" else email_file
+        print(f"\n{RGBColors.LIGHT_BLUE}📋 Starting batch investigation from: {source}{RGBColors.reset()}")
         
         try:
-            with open(email_file, 'r') as f:
-                emails = [line.strip() for line in f if line.strip() and '@' in line]
-            
-            if not emails:
-                print(f"{RGBColors.GOOGLE_RED}✗ No valid emails found in file{RGBColors.reset()}")
-                return
-            
-            print(f"{RGBColors.GOOGLE_GREEN}Found {len(emails)} email(s) to investigate{RGBColors.reset()}")
+            completed = self.enable_checkpoint(resume_from, retry_failed)
+
+            def planned_emails(stats):
+                for email in iter_unique_emails(read_email_list(email_file, column), stats):
+                    if self.shard is not None and shard_of(email, self.shard[1]) != self.shard[0]:
+                        stats["other_shards"] += 1
+                        continue
+                    if email in completed:
+                        stats["skipped_completed"] += 1
+                        continue
+                    yield email
+
+            def accept(email):
+                in_shard = self.shard is None or shard_of(email, self.shard[1]) == self.shard[0]
+                return in_shard and email not in completed
+
+            # Scheduled batches load the whole list into the priority queue
+            scheduler = None
+            total = None
+            if self.scheduling is not None:
+                scheduler = BatchScheduler(self.scheduling["drop_file"], accept)
+                stats = new_ingest_stats()
+                rows = read_email_rows(email_file, column, (self.scheduling["priority_column"],
+                                                            self.scheduling["deadline_column"]))
+                for email, priority, deadline in iter_unique_rows(rows, stats):
+                    if not accept(email):
+                        if email in completed:
+                            stats["skipped_completed"] += 1
+                        else:
+                            stats["other_shards"] += 1
+                        continue
+                    try:
+                        priority, deadline = parse_priority(priority), parse_deadline(deadline)
+                    except ValueError:
+                        stats["invalid_schedule"] += 1
+                        priority, deadline = 0, None
+                    scheduler.add(email, priority, deadline)
+                scheduler.poll()
+                self.print_ingest_summary(stats)
+                total = scheduler.queued
+                if total == 0:
+                    print(f"{RGBColors.GOOGLE_GREEN}✓ Nothing left to investigate{RGBColors.reset()}")
+                    if self.checkpoint_file is not None:
+                        self.checkpoint_file.close()
+                        self.checkpoint_file = None
+                    return
+                print(f"{RGBColors.GOOGLE_GREEN}Found {total} email(s) to investigate, most urgent first"
+                      f"{RGBColors.reset()}")
+                if scheduler.drop_file:
+                    print(f"{RGBColors.GOOGLE_GREEN}Watching {scheduler.drop_file} for urgent emails"
+                          f"{RGBColors.reset()}")
+
+            # Files get a quick counting pass first so the plan is known up front
+            elif email_file != "-":
+                stats = new_ingest_stats()
+                total = sum(1 for _ in planned_emails(stats))
+                self.print_ingest_summary(stats)
+                if total == 0:
+                    if stats["unique"]:
+                        print(f"{RGBColors.GOOGLE_GREEN}✓ Nothing left to investigate{RGBColors.reset()}")
+                    else:
+                        print(f"{RGBColors.GOOGLE_RED}✗ No valid emails found in file{RGBColors.reset()}")
+                    if self.checkpoint_file is not None:
+                        self.checkpoint_file.close()
+                        self.checkpoint_file = None
+                    return
+                print(f"{RGBColors.GOOGLE_GREEN}Found {total} email(s) to investigate{RGBColors.reset()}")
+
+            if workers > 1:
+                print(f"{RGBColors.GOOGLE_GREEN}Running up to {workers} GHunt investigations in parallel{RGBColors.reset()}")
             
-            for i, email in enumerate(emails, 1):
-                print(f"\n{RGBColors.GOOGLE_BLUE}[{i}/{len(emails)}] Processing: {email}{RGBColors.reset()}")
-                print(f"{RGBColors.GOOGLE_BLUE}{'─' * 60}{RGBColors.reset()}")  # Visual separator
-                self.email_investigation(email)
-                
-                # Add spacing between each email investigation (except for the last one)
-                if i < len(emails):
+            if scheduler is None:
+                stats = new_ingest_stats()
+            batch_start = time.monotonic()
+            position = iter(range(1, sys.maxsize))
+            def announce(email, item=None):
+                if self.quiet:
+                    return
+                i = next(position)
+                # Add spacing between each email investigation
+                if i > 1:
                     print(f"\n{RGBColors.GOOGLE_YELLOW}{'═' * 60}{RGBColors.reset()}")
                     print(f"{RGBColors.GOOGLE_YELLOW}Moving to next email...{RGBColors.reset()}")
                     print(f"{RGBColors.GOOGLE_YELLOW}{'═' * 60}{RGBColors.reset()}\n")
+                if scheduler is not None:
+                    progress = f"{i}/{scheduler.queued}"
+                    detail = f" (priority {item.priority}{', dropped' if item.source == 'drop' else ''})"
+                else:
+                    progress = f"{i}/{total}" if total is not None else f"{i}"
+                    detail = ""
+                print(f"\n{RGBColors.GOOGLE_BLUE}[{progress}] Processing: {email}{detail}{RGBColors.reset()}")
+                print(f"{RGBColors.GOOGLE_BLUE}{'─' * 60}{RGBColors.reset()}")  # Visual separator
+
+            processed = 0
+            deferred = []
+            if scheduler is not None:
+                results = self.iter_scheduled(scheduler, workers, announce)
+            else:
+                results = self.iter_investigations(planned_emails(stats), workers, announce)
+            for email, investigation_data, output in results:
+                if output:
+                    print(output)
+                # Timeouts and transient failures are recorded after their deferred retries
+                if self.deferred_retries and is_transient_failure(investigation_data):
+                    deferred.append(investigation_data)
+                    continue
+                self.record_investigation(investigation_data)
+                processed += 1
+            if deferred:
+                processed += self.retry_deferred(deferred, workers)
+
+            self.all_results["session_info"]["input"] = stats
+            if total is None:
+                self.print_ingest_summary(stats)
+            if processed == 0:
+                print(f"{RGBColors.GOOGLE_RED}✗ No valid emails found in input{RGBColors.reset()}")
+            
+            # Report throughput for the whole batch
+            elapsed = time.monotonic() - batch_start
+            per_minute = processed / elapsed * 60 if elapsed > 0 else 0.0
+            self.all_results["session_info"]["workers"] = workers
+            self.all_results["session_info"]["batch_duration_seconds"] = round(elapsed, 2)
+            self.all_results["session_info"]["throughput_per_minute"] = round(per_minute, 2)
+            if self.adaptive_timeout is not None:
+                self.all_results["session_info"]["adaptive_timeout"] = self.adaptive_timeout.stats()
+            if scheduler is not None:
+                self.all_results["session_info"]["scheduling"] = scheduler.stats()
+                self.print_schedule_summary(self.all_results["session_info"]["scheduling"])
+            if self.credential_pool is not None:
+                self.print_profile_summary(self.credential_pool.stats())
+            print(f"\n{RGBColors.LIGHT_BLUE}⏱  Processed {processed} email(s) in {elapsed:.1f}s "
+                  f"({per_minute:.1f} emails/min){RGBColors.reset()}")
             
             # Save all results to JSON file after batch completion
             print(f"\n{RGBColors.LIGHT_BLUE}📄 Saving batch investigation results...{RGBColors.reset()}")
             self.save_results_to_json()
+            if self.checkpoint_file is not None:
+                self.checkpoint_file.close()
+                self.checkpoint_file = None
                 
         except Exception as e:
             print(f"{RGBColors.GOOGLE_RED}✗ Error reading email list: {str(e)}{RGBColors.reset()}")
 
-    def setup_ghunt(self):
-        """Setup GHunt authentication"""
+    def retry_deferred(self, deferred, workers=1):
+        """Retry investigations that timed out or failed transiently in the main pass, then record them.
+
+        Up to deferred_retries rounds run within retry_budget seconds, with
+        the full --timeout (capped by the remaining budget). Every recorded
+        investigation keeps its number of deferred retries and the outcome
+        of the earlier attempts. Returns the number recorded.
+        """
+        print(f"\n{RGBColors.LIGHT_BLUE}🔁 Retrying {len(deferred)} timed out or transiently failed email(s) "
+              f"(up to {self.deferred_retries} time(s), {self.retry_budget:g}s budget){RGBColors.reset()}")
+        pending = {investigation_data["email"]: investigation_data for investigation_data in deferred}
+        history = {email: [] for email in pending}
+        summary = {"queued": len(pending), "recovered": 0, "budget_seconds": self.retry_budget}
+        self.retry_deadline = time.monotonic() + self.retry_budget
+        try:
+            for _ in range(self.deferred_retries):
+                if not pending or time.monotonic() >= self.retry_deadline:
+                    break
+
+                def due():
+                    for email in list(pending):
+                        # Emails not started before the budget runs out keep their last outcome
+                        if time.monotonic() >= self.retry_deadline:
+                            return
+                        yield email
+
+                still_failing = {}
+                for email, investigation_data, output in self.iter_investigations(due(), workers):
+                    if output:
+                        print(output)
+                    previous = pending.pop(email)
+                    if "schedule" in previous:
+                        investigation_data["schedule"] = previous["schedule"]
+                    history[email].append({key: previous[key] for key in ("status", "error", "timestamp")
+                                           if key in previous})
+                    if is_transient_failure(investigation_data):
+                        still_failing[email] = investigation_data
+                    else:
+                        summary["recovered"] += 1
+                        self._record_retried(investigation_data, history[email])
+                pending.update(still_failing)
+        finally:
+            self.retry_deadline = None
+
+        for email, investigation_data in pending.items():
+            self._record_retried(investigation_data, history[email])
+        summary["still_failing"] = len(pending)
+        self.all_results["session_info"]["deferred_retries"] = summary
+        print(f"{RGBColors.GOOGLE_GREEN}✓ Deferred retries recovered {summary['recovered']} of "
+              f"{summary['queued']} email(s){RGBColors.reset()}")
+        return summary["queued"]
+
+    def _record_retried(self, investigation_data, attempts):
+        """Record an investigation from the deferred retry queue with its earlier attempts"""
+        investigation_data["deferred_retries"] = len(attempts)
+        if attempts:
+            investigation_data["previous_attempts"] = attempts
+        self.record_investigation(investigation_data)
+
+    def print_ingest_summary(self, stats):
+        """Show how the input list was reduced before running GHunt"""
+        print(f"{RGBColors.GOOGLE_GREEN}Read {stats['lines_read']} line(s): {stats['unique']} unique email(s), "
+              f"{stats['duplicates']} duplicate(s) or alias(es), {stats['invalid']} invalid{RGBColors.reset()}")
+        if stats["duplicates"]:
+            print(f"{RGBColors.GOOGLE_GREEN}✓ Deduplication saves {stats['duplicates']} GHunt run(s){RGBColors.reset()}")
+        if self.shard is not None:
+            print(f"{RGBColors.GOOGLE_GREEN}Shard {self.shard[0]}/{self.shard[1]}: leaving "
+                  f"{stats['other_shards']} email(s) to the other shards{RGBColors.reset()}")
+        if stats["invalid_schedule"]:
+            print(f"{RGBColors.GOOGLE_YELLOW}✗ {stats['invalid_schedule']} row(s) with an unreadable priority or "
+                  f"deadline were queued with the defaults{RGBColors.reset()}")
+        if stats["skipped_completed"]:
+            self.all_results["session_info"]["skipped_completed"] = stats["skipped_completed"]
+            print(f"{RGBColors.GOOGLE_GREEN}Skipping {stats['skipped_completed']} email(s) finished in a previous run{RGBColors.reset()}")
+
+    def setup_ghunt(self, creds_paths=None):
+        """Setup GHunt authentication
+
+        With creds_paths, `ghunt login` runs once for each credentials file
+        and the session is saved to that file instead of GHunt's default
+        location, building the profiles of a credential pool.
+        """
         print(f"\n{RGBColors.LIGHT_BLUE}⚙️  Setting up GHunt authentication...{RGBColors.reset()}")
         print(f"{RGBColors.GOOGLE_YELLOW}This will guide you through the GHunt setup process{RGBColors.reset()}")
         
-        try:
-            # Run GHunt login to setup authentication (banner will show during interactive setup)
-            subprocess.run(['ghunt', 'login'], timeout=300)
-            print(f"{RGBColors.GOOGLE_GREEN}✓ GHunt authentication setup completed{RGBColors.reset()}")
-        except subprocess.TimeoutExpired:
-            print(f"{RGBColors.GOOGLE_RED}✗ Setup process timed out{RGBColors.reset()}")
-        except Exception as e:
-            print(f"{RGBColors.GOOGLE_RED}✗ Error during setup: {str(e)}{RGBColors.reset()}")
+        for creds_path in creds_paths or [None]:
+            home = None
+            try:
+                env = None
+                if creds_path is not None:
+                    if os.path.isdir(creds_path):
+                        print(f"{RGBColors.GOOGLE_RED}✗ {creds_path} is a folder, give the credentials file "
+                              f"to create (e.g. {os.path.join(creds_path, 'account1.m')}){RGBColors.reset()}")
+                        continue
+                    import tempfile
+                    home = tempfile.mkdtemp(prefix="goosint-login-")
+                    env = dict(os.environ, **profile_environment(home))
+                    print(f"\n{RGBColors.LIGHT_BLUE}Logging in credential profile: {creds_path}{RGBColors.reset()}")
+                # Run GHunt login to setup authentication (banner will show during interactive setup)
+                subprocess.run(['ghunt', 'login'], timeout=300, env=env)
+                if creds_path is not None:
+                    created = os.path.join(home, ".malfrats", "ghunt", "creds.m")
+                    if not os.path.isfile(created):
+                        print(f"{RGBColors.GOOGLE_RED}✗ GHunt didn't save a session for {creds_path}{RGBColors.reset()}")
+                        continue
+                    os.makedirs(os.path.dirname(os.path.abspath(creds_path)), exist_ok=True)
+                    shutil.copyfile(created, creds_path)
+                print(f"{RGBColors.GOOGLE_GREEN}✓ GHunt authentication setup completed{RGBColors.reset()}")
+            except subprocess.TimeoutExpired:
+                print(f"{RGBColors.GOOGLE_RED}✗ Setup process timed out{RGBColors.reset()}")
+            except Exception as e:
+                print(f"{RGBColors.GOOGLE_RED}✗ Error during setup: {str(e)}{RGBColors.reset()}")
+            finally:
+                if home is not None:
+                    shutil.rmtree(home, ignore_errors=True)
 
     def show_help(self):
         """Display help information"""
@@ -421,13 +3365,48 @@ class GoOsint:
 {RGBColors.GOOGLE_GREEN}Commands:{RGBColors.reset()}
   -e, --email EMAIL     Investigate a single email address
   -f, --file FILE       Batch investigate emails from file
-  -s, --setup          Setup GHunt authentication
+  --column NAME|INDEX  CSV column with the email addresses
+  --priority-column C  Column with each email's priority (higher runs first)
+  --deadline-column C  Column with deadlines (ISO time or "30m", "2h", ...)
+  --drop-file FILE     Add emails appended to FILE to the running batch
+  -w, --workers N       Parallel GHunt runs in batch mode (default: 1)
+  --stream             Append results to a .jsonl file as they finish
+  --pretty             With --stream, also write the .json file at the end
+  --convert STREAM     Convert a .jsonl results stream to .json
+  --resume RESULTS     Skip emails already finished in a previous batch
+  --retry-failed       With --resume, re-run failed and timed out emails
+  --rate RPS           Max GHunt calls per second (adaptive)
+  --max-retries N      Retries for rate-limited emails (default: 3)
+  --backend MODE       auto, library (in-process) or subprocess
+  --timeout SECONDS    Time limit for one GHunt run (default: 60)
+  --diff-against SRC   Store only changes since SRC (results file or "index")
+  --shard K/N          Only investigate part K of N of the email list
+  merge FILE... [-o OUT] Combine results of several shards into one file
+  --serve [ADDRESS]    Run as a local job server (HOST:PORT or socket path)
+  --query QUERY        Search past results (e.g. "gaia:123", "maps_reviews>0")
+  --export FILE        With --query, save the matches as .csv or JSONL
+  --no-index           Don't add this run's results to the results index
+  --raw MODE           Raw GHunt output: inline (default), blob or none
+  -q, --quiet          Don't print GHunt output, only progress and summaries
+  --output-format FMT  text (default) or jsonl: one JSON record per email on stdout
+  --adaptive-timeout [K] Limit GHunt runs to K x the batch's p95 latency (default K: 3)
+  --deferred-retries N Retry timeouts/transient failures after the batch (default: 0)
+  --retry-budget SEC   Time budget for the deferred retries (default: 600)
+  --metrics FILE       Write run metrics (.prom for Prometheus, else JSON)
+  --profile FILE       Save a cProfile of parsing and rendering
+  --no-cache           Always run GHunt, don't use the results cache
+  --refresh            Re-run GHunt and update the results cache
+  --cache-ttl HOURS    Cache validity in hours (default: 24)
+  --creds PATH         GHunt credentials file or folder of *.m files (repeatable)
+  --creds-cooldown SEC Pause for a rate-limited credential profile (default: 60)
+  -s, --setup          Setup GHunt authentication (with --creds, one login per file)
   -i, --install        Install/reinstall GHunt
   -h, --help           Show this help message
 
 {RGBColors.GOOGLE_GREEN}Examples:{RGBColors.reset()}
   python3 goosint.py -e target@gmail.com
   python3 goosint.py -f email_list.txt
+  python3 goosint.py -f email_list.txt --workers 8
   python3 goosint.py --setup
 
 {RGBColors.GOOGLE_GREEN}Email List Format:{RGBColors.reset()}
@@ -435,10 +3414,13 @@ class GoOsint:
   target1@gmail.com
   target2@gmail.com
   target3@gmail.com
+  CSV files (--column), .gz files and stdin (-f -) are also accepted.
+  Duplicates and Gmail aliases (dots, +tags) are investigated once.
 
 {RGBColors.GOOGLE_GREEN}Output:{RGBColors.reset()}
   Results are saved in JSON format to: results/
   Each investigation session creates a timestamped file.
+  Successful lookups are cached in results/cache.sqlite3.
 
 {RGBColors.GOOGLE_RED}Legal Notice:{RGBColors.reset()}
   This tool is for educational and legal OSINT purposes only.
@@ -448,7 +3430,204 @@ class GoOsint:
 """
         print(help_text)
 
+class InvestigationServer:
+    """Job queue that investigates emails for local clients (see --serve).
+
+    One GoOsint instance stays warm for the whole server: the GHunt engine
+    or installation check, cache, rate limiter and results stream are set
+    up once and shared by every job. Jobs are run by `workers` threads and
+    recorded as they finish.
+
+    HTTP API (JSON in and out):
+      POST /investigate   {"email": "..."} or {"emails": [...]}, optional "wait": false
+      GET  /jobs/<id>     state and result of one job
+      GET  /health        queue and job counters
+    """
+
+    def __init__(self, goosint, workers=1, max_jobs=10000):
+        import queue
+        self.goosint = goosint
+        self.workers = max(1, workers)
+        # Finished jobs beyond max_jobs are forgotten, oldest first
+        self.max_jobs = max_jobs
+        self.jobs = {}
+        self.finished = deque()
+        self.queue = queue.Queue()
+        self.processed = 0
+        self.started = time.time()
+        self._next_id = iter(range(1, sys.maxsize))
+        self._lock = threading.Lock()
+        self._record_lock = threading.Lock()
+        self.httpd = None
+
+    def submit(self, emails):
+        """Queue one job per email and return them"""
+        jobs = []
+        with self._lock:
+            for email in emails:
+                job = {"id": next(self._next_id), "email": email, "state": "queued",
+                       "submitted": datetime.now().isoformat(), "result": None,
+                       "done": threading.Event()}
+                self.jobs[job["id"]] = job
+                jobs.append(job)
+        for job in jobs:
+            self.queue.put(job)
+        return jobs
+
+    def _work(self):
+        while True:
+            job = self.queue.get()
+            job["state"] = "running"
+            try:
+                investigation_data, output = self.goosint.investigate_email(job["email"])
+                if output:
+                    print(output)
+                # Recording writes the shared stream and checkpoint, one job at a time
+                with self._record_lock:
+                    self.goosint.record_investigation(investigation_data)
+                job["result"] = investigation_data
+            except Exception as e:
+                job["result"] = {"email": job["email"], "timestamp": datetime.now().isoformat(),
+                                 "status": "error", "error": str(e)}
+            job["state"] = "done"
+            job["done"].set()
+            status = job["result"].get("status")
+            color = RGBColors.GOOGLE_GREEN if status == "success" else RGBColors.GOOGLE_YELLOW
+            print(f"{color}[job {job['id']}] {job['email']}: {status}{RGBColors.reset()}")
+            with self._lock:
+                self.processed += 1
+                self.finished.append(job["id"])
+                while len(self.finished) > self.max_jobs:
+                    self.jobs.pop(self.finished.popleft(), None)
+
+    @staticmethod
+    def describe(job):
+        """JSON view of a job"""
+        return {key: value for key, value in job.items() if key != "done"}
+
+    def stats(self):
+        with self._lock:
+            return {"status": "ok", "uptime_seconds": round(time.time() - self.started, 1),
+                    "workers": self.workers, "queued": self.queue.qsize(),
+                    "processed": self.processed, "tracked_jobs": len(self.jobs)}
+
+    def serve(self, address):
+        """Start the workers and answer HTTP requests until interrupted.
+
+        address is "HOST:PORT" for TCP or a filesystem path for a Unix socket.
+        """
+        import socketserver
+        from http.server import ThreadingHTTPServer
+
+        for _ in range(self.workers):
+            threading.Thread(target=self._work, daemon=True).start()
+
+        handler = self._make_handler()
+        if "/" in address:
+            if os.path.exists(address):
+                os.unlink(address)
+            class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+                daemon_threads = True
+            httpd = UnixHTTPServer(address, handler)
+            os.chmod(address, 0o600)
+            where = f"unix:{address}"
+        else:
+            host, _, port = address.rpartition(":")
+            httpd = ThreadingHTTPServer((host or "127.0.0.1", int(port)), handler)
+            where = f"http://{host or '127.0.0.1'}:{httpd.server_address[1]}"
+
+        self.httpd = httpd
+        print(f"{RGBColors.GOOGLE_GREEN}✓ Serving investigations on {where} "
+              f"with {self.workers} worker(s), press Ctrl+C to stop{RGBColors.reset()}")
+        try:
+            httpd.serve_forever()
+        finally:
+            self.httpd = None
+            httpd.server_close()
+            if "/" in address and os.path.exists(address):
+                os.unlink(address)
+
+    def shutdown(self):
+        """Make serve() return; safe to call from a signal handler"""
+        httpd = self.httpd
+        if httpd is not None:
+            # shutdown() waits for serve_forever(), which may be running on the calling thread
+            threading.Thread(target=httpd.shutdown, daemon=True).start()
+
+    def _make_handler(self):
+        from http.server import BaseHTTPRequestHandler
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def send_json(self, code, payload):
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path == "/health":
+                    return self.send_json(200, server.stats())
+                if self.path.startswith("/jobs/"):
+                    job = server.jobs.get(int(self.path[6:])) if self.path[6:].isdigit() else None
+                    if job is None:
+                        return self.send_json(404, {"error": "unknown job"})
+                    return self.send_json(200, server.describe(job))
+                self.send_json(404, {"error": "not found"})
+
+            def do_POST(self):
+                if self.path != "/investigate":
+                    return self.send_json(404, {"error": "not found"})
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    request = json.loads(self.rfile.read(length) or b"{}")
+                    emails = request.get("emails") or ([request["email"]] if request.get("email") else [])
+                except (ValueError, AttributeError, KeyError):
+                    return self.send_json(400, {"error": "expected a JSON object with email or emails"})
+                if not isinstance(emails, list) or not all(isinstance(email, str) for email in emails):
+                    return self.send_json(400, {"error": "email must be a string and emails a list of strings"})
+                invalid = [email for email in emails if not is_valid_email(email)]
+                if not emails or invalid:
+                    return self.send_json(400, {"error": "no valid emails", "invalid": invalid})
+                jobs = server.submit(emails)
+                if request.get("wait", True) is False:
+                    return self.send_json(202, {"jobs": [server.describe(job) for job in jobs]})
+                for job in jobs:
+                    job["done"].wait()
+                self.send_json(200, {"jobs": [server.describe(job) for job in jobs]})
+
+        return Handler
+
+def merge_main(argv):
+    """Entry point of the `merge` subcommand"""
+    parser = argparse.ArgumentParser(prog='GoOsint.py merge',
+                                     description='Combine results of several runs or shards into one session file')
+    parser.add_argument('files', nargs='+', metavar='FILE',
+                       help='investigation_*.json session files or .jsonl results streams')
+    parser.add_argument('-o', '--output',
+                       help='Merged results file (default: results/investigation_<time>_merged.json)')
+    args = parser.parse_args(argv)
+    output = args.output
+    if output is None:
+        os.makedirs("results", exist_ok=True)
+        output = os.path.join("results", f"investigation_{datetime.now().strftime('%Y%m%d_%H%M%S')}_merged.json")
+    return merge_results(args.files, output) is not None
+
 def main():
+    # Initialize colorama for cross-platform colored output
+    from colorama import init
+    init(autoreset=True)
+    
+    if len(sys.argv) > 1 and sys.argv[1] == 'merge':
+        if not merge_main(sys.argv[2:]):
+            sys.exit(1)
+        return
+    
     parser = argparse.ArgumentParser(
         description="GoOsint - Gmail OSINT Tool powered by GHunt",
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -457,66 +3636,239 @@ def main():
     parser.add_argument('-e', '--email', 
                        help='Email address to investigate')
     parser.add_argument('-f', '--file', 
-                       help='File containing list of emails to investigate')
+                       help='File containing list of emails to investigate (.txt, .csv, .gz or - for stdin)')
     parser.add_argument('-s', '--setup', action='store_true',
                        help='Setup GHunt authentication')
     parser.add_argument('-i', '--install', action='store_true',
                        help='Install/reinstall GHunt')
     parser.add_argument('--no-banner', action='store_true',
                        help='Skip banner display')
+    parser.add_argument('--column', metavar='NAME|INDEX',
+                       help='CSV column holding the email addresses (header name or 0-based index)')
+    parser.add_argument('--priority-column', metavar='NAME|INDEX',
+                       help='List column with a priority per email; the batch runs the highest priority '
+                            'first (default priority: 0)')
+    parser.add_argument('--deadline-column', metavar='NAME|INDEX',
+                       help='List column with a deadline per email (ISO 8601 time or a duration such as '
+                            '"30m"); earlier deadlines run first within a priority')
+    parser.add_argument('--drop-file', metavar='FILE',
+                       help='While a batch runs, add lines appended to FILE ("email[,priority[,deadline]]", '
+                            f'default priority {DROP_FILE_PRIORITY}) to its queue')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                       help='Number of GHunt investigations to run in parallel in batch mode (default: 1)')
+    parser.add_argument('--stream', action='store_true',
+                       help='Append each result to a JSONL file as soon as it finishes')
+    parser.add_argument('--pretty', action='store_true',
+                       help='With --stream, also write the pretty-printed JSON file at the end')
+    parser.add_argument('--convert', metavar='STREAM',
+                       help='Convert a JSONL results stream to the pretty-printed JSON format and exit')
+    parser.add_argument('--resume', metavar='RESULTS',
+                       help='Resume a batch, skipping emails already finished in this results/checkpoint file')
+    parser.add_argument('--retry-failed', action='store_true',
+                       help='With --resume, investigate failed, timed out and errored emails again')
+    parser.add_argument('--backend', choices=['auto', 'library', 'subprocess'], default='auto',
+                       help='How GHunt is run: in-process with a shared session (library), one ghunt '
+                            'process per email (subprocess), or library with subprocess fallback (auto, default)')
+    parser.add_argument('--timeout', type=float, default=60, metavar='SECONDS',
+                       help='Give up on a GHunt run after this many seconds (default: 60)')
+    parser.add_argument('--diff-against', metavar='SOURCE',
+                       help='Store only the profile/services fields that changed since SOURCE, a previous '
+                            'results file or "index" for the results index (chains daily runs)')
+    parser.add_argument('--shard', metavar='K/N',
+                       help='Investigate only the K-th of N hash-based parts of the email list, '
+                            'so N processes or hosts can share one list (combine them with "merge")')
+    parser.add_argument('--serve', nargs='?', const='127.0.0.1:8765', metavar='ADDRESS',
+                       help='Keep running and investigate emails submitted over HTTP on ADDRESS '
+                            '(HOST:PORT, default 127.0.0.1:8765, or a Unix socket path)')
+    parser.add_argument('--query', metavar='QUERY',
+                       help='Search all saved results through the SQLite index, e.g. "gaia:1184...", '
+                            '"status:success maps_reviews>0", "activated_services:Youtube since:2025-01-01"')
+    parser.add_argument('--export', metavar='FILE',
+                       help='With --query, write the matching investigations to FILE (.csv, otherwise JSONL)')
+    parser.add_argument('--limit', type=int, metavar='N',
+                       help='With --query, show at most N investigations')
+    parser.add_argument('--index', action=argparse.BooleanOptionalAction, default=True,
+                       help='Add saved results to the results index used by --query (default: enabled)')
+    parser.add_argument('--raw', choices=['none', 'inline', 'blob'], default='inline',
+                       help='Keep raw GHunt output in the results (inline, default), in the compressed '
+                            'content-addressed store results/blobs (blob), or not at all (none)')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                       help="Don't render GHunt output or per-email messages")
+    parser.add_argument('--output-format', choices=['text', 'jsonl'], default='text',
+                       help='text: colored console output (default); jsonl: one compact JSON record '
+                            'per email on stdout, all other messages on stderr')
+    parser.add_argument('--adaptive-timeout', type=float, nargs='?', const=3.0, metavar='K',
+                       help="In batch mode, give up on a GHunt run after K times the p95 latency seen so far "
+                            "(default K: 3, never more than --timeout)")
+    parser.add_argument('--deferred-retries', type=int, default=0, metavar='N',
+                       help='Retry timed out and transiently failed emails up to N times after the main batch '
+                            'pass; they are then recorded out of input order (default: 0)')
+    parser.add_argument('--retry-budget', type=float, default=600, metavar='SECONDS',
+                       help='Total time allowed for the deferred retries (default: 600)')
+    parser.add_argument('--metrics', metavar='FILE',
+                       help='Write counters and stage timings for the run to FILE '
+                            '(Prometheus textfile format for .prom, JSON otherwise)')
+    parser.add_argument('--profile', metavar='FILE',
+                       help='Profile GHunt output parsing and rendering with cProfile and save the stats to FILE')
+    parser.add_argument('--rate', type=float, metavar='RPS',
+                       help='Maximum GHunt calls per second; slowed down automatically when throttled')
+    parser.add_argument('--max-retries', type=int, default=3, metavar='N',
+                       help='Retries for a rate-limited investigation (default: 3)')
+    parser.add_argument('--creds', action='append', metavar='PATH',
+                       help='GHunt credentials file (or folder of *.m files) to add to the credential pool; '
+                            'repeat it to spread GHunt runs over several accounts. With --setup, log in '
+                            'and save the session to each file')
+    parser.add_argument('--creds-cooldown', type=float, default=60, metavar='SECONDS',
+                       help='How long a rate-limited credential profile is rested, doubling on repeated '
+                            'errors (auth errors: 10x; default: 60)')
+    parser.add_argument('--cache', action=argparse.BooleanOptionalAction, default=True,
+                       help='Reuse recent results from the on-disk investigation cache (default: enabled)')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Ignore cached results but store fresh ones in the cache')
+    parser.add_argument('--cache-ttl', type=float, default=24, metavar='HOURS',
+                       help='How long cached results stay valid (default: 24 hours)')
+    parser.add_argument('--cache-max-entries', type=int, default=50000, metavar='N',
+                       help='Maximum number of cached investigations before the oldest are evicted (default: 50000)')
     
     args = parser.parse_args()
     
+    # Keep stdout for the JSONL records; messages (and GHunt's own) go to stderr
+    records = None
+    if args.output_format == 'jsonl':
+        records = sys.stdout
+        sys.stdout = sys.stderr
+    
     # Initialize GoOsint
     goosint = GoOsint()
+    try:
+        if args.shard:
+            try:
+                goosint.set_shard(*parse_shard(args.shard))
+            except ValueError as e:
+                print(f"{RGBColors.GOOGLE_RED}✗ Invalid --shard value: {str(e)}{RGBColors.reset()}")
+                return
     
-    # Show banner unless disabled
-    if not args.no_banner:
-        goosint.print_banner()
+        # Show banner unless disabled
+        if not args.no_banner:
+            goosint.print_banner()
     
-    # If no arguments provided, show help
-    if len(sys.argv) == 1:
-        goosint.show_help()
-        return
+        # If no arguments provided, show help
+        if len(sys.argv) == 1:
+            goosint.show_help()
+            return
     
-    # Handle install option
-    if args.install:
-        goosint.install_ghunt()
-        return
+        # Convert an existing results stream without touching GHunt
+        if args.convert:
+            convert_stream_to_json(args.convert)
+            return
     
-    # Handle setup option
-    if args.setup:
-        goosint.setup_ghunt()
-        return
+        # Search past results without touching GHunt
+        if args.query is not None:
+            if records is not None:
+                goosint.enable_quiet(records)
+            goosint.query_results(args.query, export=args.export, limit=args.limit)
+            return
     
-    # Check if GHunt is installed
-    if not goosint.check_ghunt_installation():
-        print(f"\n{RGBColors.GOOGLE_YELLOW}GHunt is required but not installed.{RGBColors.reset()}")
-        install = input(f"{RGBColors.LIGHT_BLUE}Would you like to install it now? (y/n): {RGBColors.reset()}")
-        if install.lower() in ['y', 'yes']:
-            if goosint.install_ghunt():
-                print(f"{RGBColors.GOOGLE_GREEN}Installation complete! Please run the setup command:{RGBColors.reset()}")
-                print(f"{RGBColors.LIGHT_BLUE}python3 GoOsint.py --setup{RGBColors.reset()}")
+        # Handle install option
+        if args.install:
+            goosint.install_ghunt()
             return
-        else:
-            print(f"{RGBColors.GOOGLE_RED}GHunt is required to use GoOsint. Exiting.{RGBColors.reset()}")
+    
+        # Handle setup option
+        if args.setup:
+            goosint.setup_ghunt(args.creds)
             return
     
-    # Handle email investigation
-    if args.email:
-        if '@' not in args.email:
-            print(f"{RGBColors.GOOGLE_RED}✗ Invalid email format: {args.email}{RGBColors.reset()}")
+        # Check if GHunt is installed
+        if not goosint.check_ghunt_installation():
+            print(f"\n{RGBColors.GOOGLE_YELLOW}GHunt is required but not installed.{RGBColors.reset()}")
+            install = input(f"{RGBColors.LIGHT_BLUE}Would you like to install it now? (y/n): {RGBColors.reset()}")
+            if install.lower() in ['y', 'yes']:
+                if goosint.install_ghunt():
+                    print(f"{RGBColors.GOOGLE_GREEN}Installation complete! Please run the setup command:{RGBColors.reset()}")
+                    print(f"{RGBColors.LIGHT_BLUE}python3 GoOsint.py --setup{RGBColors.reset()}")
+                return
+            else:
+                print(f"{RGBColors.GOOGLE_RED}GHunt is required to use GoOsint. Exiting.{RGBColors.reset()}")
+                return
+    
+        # Spread GHunt runs over several accounts
+        if args.creds and not goosint.enable_credential_pool(args.creds, max(0.0, args.creds_cooldown)):
             return
-        goosint.email_investigation(args.email)
-        # Save results to JSON file
-        goosint.save_results_to_json()
     
-    # Handle batch investigation
-    elif args.file:
-        goosint.batch_investigation(args.file)
+        # Reuse one in-process GHunt session when possible
+        if args.backend != 'subprocess' and GHUNT_AVAILABLE:
+            goosint.enable_library_backend(required=args.backend == 'library', lazy=True)
+        elif args.backend == 'library':
+            print(f"{RGBColors.GOOGLE_RED}✗ GHunt package not importable, using the ghunt command instead{RGBColors.reset()}")
     
-    else:
-        goosint.show_help()
+        goosint.ghunt_timeout = args.timeout if args.timeout > 0 else 60
+        if args.adaptive_timeout:
+            goosint.enable_adaptive_timeout(args.adaptive_timeout)
+        if args.deferred_retries > 0:
+            goosint.enable_deferred_retries(args.deferred_retries, args.retry_budget)
+    
+        # Run the most urgent emails of a batch first
+        if args.priority_column or args.deadline_column or args.drop_file:
+            goosint.enable_scheduling(args.priority_column, args.deadline_column, args.drop_file)
+    
+        # Store a change feed instead of full records
+        if args.diff_against and not goosint.enable_diff(args.diff_against):
+            return
+    
+        # Keep the results index up to date with every run
+        if args.index:
+            goosint.enable_index()
+    
+        # Keep raw GHunt output inline, in the blob store or not at all
+        goosint.set_raw_output(args.raw)
+    
+        # Skip rendering when the output is piped to logs or other tools
+        if args.quiet or records is not None:
+            goosint.enable_quiet(records)
+    
+        # Collect run metrics and profiles
+        if args.metrics:
+            goosint.enable_metrics(args.metrics)
+        if args.profile:
+            goosint.enable_profile(args.profile)
+    
+        # Pace GHunt calls and back off when Google throttles
+        goosint.enable_rate_limit(rate=args.rate, max_retries=max(0, args.max_retries))
+    
+        # Stream results to disk as they finish
+        if args.stream:
+            goosint.enable_stream(pretty=args.pretty)
+    
+        # Open the investigation cache unless disabled
+        if args.cache:
+            goosint.enable_cache(ttl_hours=args.cache_ttl, max_entries=args.cache_max_entries,
+                                 refresh=args.refresh)
+    
+        # Run as a job server with warm state
+        if args.serve:
+            goosint.serve(args.serve, workers=max(1, args.workers))
+    
+        # Handle email investigation
+        elif args.email:
+            if '@' not in args.email:
+                print(f"{RGBColors.GOOGLE_RED}✗ Invalid email format: {args.email}{RGBColors.reset()}")
+                return
+            goosint.email_investigation(args.email)
+            # Save results to JSON file
+            goosint.save_results_to_json()
+    
+        # Handle batch investigation
+        elif args.file:
+            goosint.batch_investigation(args.file, workers=max(1, args.workers),
+                                        resume_from=args.resume, retry_failed=args.retry_failed,
+                                        column=args.column)
+    
+        else:
+            goosint.show_help()
+    finally:
+        # Also on early returns and Ctrl-C: saves metrics/profile, removes credential homes
+        goosint.close()
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Compare the per-email overhead of GoOsint's GHunt backends
+
+The subprocess backend starts a `ghunt email` process for every address,
+while the library backend reuses one in-process GHunt session. Without a
+GHunt session only the subprocess backend can be timed: benchmarks/
+fake_ghunt.py is put on PATH as `ghunt` with no latency, so the figure is
+GoOsint's fixed cost per email for spawning GHunt and reading its output.
+With --live and a working `ghunt login`, real investigations are timed with
+both backends.
+
+Usage:
+  python3 benchmarks/bench_backends.py
+  python3 benchmarks/bench_backends.py --live -e target1@gmail.com -e target2@gmail.com
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from bench_batch import install_fake_ghunt
+
+# Statuses that mean the backend itself broke rather than the target having no data
+BROKEN_STATUSES = ("error", "failed")
+
+def summarize(samples):
+    """Return mean/median/min/max in milliseconds for a list of seconds"""
+    return {
+        "runs": len(samples),
+        "mean_ms": round(statistics.mean(samples) * 1000, 2),
+        "median_ms": round(statistics.median(samples) * 1000, 2),
+        "min_ms": round(min(samples) * 1000, 2),
+        "max_ms": round(max(samples) * 1000, 2),
+    }
+
+def check_command(command, env):
+    """Run command once and exit with its stderr when it fails"""
+    result = subprocess.run(command, capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        sys.exit(f"{' '.join(command)} exited with status {result.returncode}:\n{result.stderr.strip()}")
+
+def time_investigations(goosint, emails, runs):
+    """Time investigate_email over emails; exit if any run reports a broken backend"""
+    samples = []
+    for _ in range(runs):
+        for email in emails:
+            start = time.perf_counter()
+            investigation_data, _ = goosint.investigate_email(email)
+            samples.append(time.perf_counter() - start)
+            if investigation_data.get("status") in BROKEN_STATUSES:
+                sys.exit(f"Investigation of {email} failed: {investigation_data.get('error')}")
+    return summarize(samples)
+
+def bench_subprocess(runs):
+    """Per-email cost of the subprocess backend against a zero-latency fake ghunt"""
+    from GoOsint import GoOsint
+
+    with tempfile.TemporaryDirectory(prefix="goosint-bench-") as scratch:
+        path = install_fake_ghunt(scratch) + os.pathsep + os.environ.get("PATH", "")
+        env = dict(os.environ, PATH=path, FAKE_GHUNT_LATENCY="0")
+        check_command(['ghunt', 'email', 'probe@gmail.com'], env)
+        saved_env = dict(os.environ)
+        os.environ.update(env)
+        try:
+            goosint = GoOsint()
+            goosint.enable_quiet()
+            return time_investigations(goosint, ['target@gmail.com'], runs)
+        finally:
+            os.environ.clear()
+            os.environ.update(saved_env)
+
+def bench_live(emails, runs):
+    """Time real investigations with both backends"""
+    from GoOsint import GoOsint
+
+    results = {}
+    for backend in ('subprocess', 'library'):
+        goosint = GoOsint()
+        if backend == 'library' and not goosint.enable_library_backend(required=True):
+            continue
+        try:
+            results[backend] = time_investigations(goosint, emails, runs)
+        finally:
+            goosint.close()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GoOsint's GHunt backends")
+    parser.add_argument('-n', '--runs', type=int, default=10,
+                       help='Repetitions per measurement (default: 10)')
+    parser.add_argument('--live', action='store_true',
+                       help='Also run real investigations (needs a GHunt session)')
+    parser.add_argument('-e', '--email', action='append', default=[],
+                       help='Email to investigate in --live mode (repeatable)')
+    parser.add_argument('-o', '--output',
+                       help='Write the results as JSON to this file')
+    args = parser.parse_args()
+
+    report = {"subprocess_fake_ghunt": bench_subprocess(args.runs)}
+    if args.live and args.email:
+        report["live"] = bench_live(args.email, args.runs)
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
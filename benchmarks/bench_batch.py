@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput and latency benchmark for GoOsint
+
+Puts benchmarks/fake_ghunt.py on PATH as `ghunt` and runs GoOsint's single
+(-e) and batch (-f) modes against it in a temporary directory, so no Google
+session or network access is needed. The fake's latency, jitter, failure
+rate and hangs are configurable, and every run reports emails/sec, p50/p95/
+p99 per-email latency, peak RSS and the size of the results file. With
+--profiles, GoOsint spreads the runs over that many fake credential
+profiles, some of which can be made to always hit the rate limit. The report
+is written as JSON so runs of different versions can be compared offline.
+
+Usage:
+  python3 benchmarks/bench_batch.py
+  python3 benchmarks/bench_batch.py --sizes 10 100 500 --workers 1 8 -o batch_bench.json
+  python3 benchmarks/bench_batch.py --failure-rate 0.05 --timeout-rate 0.01 --timeout 2
+  python3 benchmarks/bench_batch.py --profiles 4 --throttled-profiles 1 --workers 4
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+SCRIPT = os.path.join(ROOT, "GoOsint.py")
+FAKE_GHUNT = os.path.join(ROOT, "benchmarks", "fake_ghunt.py")
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+def latency_stats(samples):
+    """p50/p95/p99/max in milliseconds for a list of seconds"""
+    stats = {"count": len(samples)}
+    for name, pct in (("p50_ms", 50), ("p95_ms", 95), ("p99_ms", 99), ("max_ms", 100)):
+        value = percentile(samples, pct)
+        stats[name] = round(value * 1000, 2) if value is not None else None
+    return stats
+
+def install_fake_ghunt(workdir):
+    """Create a bin/ folder whose `ghunt` runs fake_ghunt.py; return its path"""
+    bindir = os.path.join(workdir, "bin")
+    os.makedirs(bindir)
+    wrapper = os.path.join(bindir, "ghunt")
+    with open(wrapper, 'w') as f:
+        f.write(f'#!/bin/sh\nexec "{sys.executable}" "{FAKE_GHUNT}" "$@"\n')
+    os.chmod(wrapper, 0o755)
+    return bindir
+
+def install_fake_profiles(workdir, count):
+    """Create count fake credentials files; return their folder"""
+    creds_dir = os.path.join(workdir, "creds")
+    os.makedirs(creds_dir)
+    for index in range(1, count + 1):
+        with open(os.path.join(creds_dir, f"profile{index}.m"), 'w') as f:
+            f.write("fake session\n")
+    return creds_dir
+
+def run_goosint(args, cwd, env):
+    """Run GoOsint once; return (wall seconds, peak RSS in KiB).
+
+    Exits with GoOsint's stderr when it fails, so a crashed run is never
+    reported as a timing. Deferred retries are turned off so a retry pass
+    over the fake's failures isn't mixed into the measured throughput.
+    """
+    command = [sys.executable, SCRIPT, '--no-banner', '--no-cache', '--backend', 'subprocess',
+               '--deferred-retries', '0'] + args
+    with tempfile.TemporaryFile(mode='w+', dir=cwd) as stderr:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=cwd, env=env, stdin=subprocess.DEVNULL,
+                                   stdout=subprocess.DEVNULL, stderr=stderr)
+        # wait4 reports the resource usage of this child alone
+        _, status, usage = os.wait4(process.pid, 0)
+        wall = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+        if process.returncode != 0:
+            stderr.seek(0)
+            sys.exit(f"GoOsint {' '.join(args)} exited with status {process.returncode}:\n"
+                     f"{stderr.read().strip()}")
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    peak_rss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return wall, peak_rss
+
+def collect_results(results_dir):
+    """Read every saved investigation; return (investigations, file sizes, load seconds)
+
+    File sizes are the bytes of the results files and of the raw output
+    blob store (--raw blob).
+    """
+    investigations = []
+    sizes = {"results_file_bytes": 0, "blob_bytes": 0}
+    start = time.perf_counter()
+    for path in sorted(glob.glob(os.path.join(results_dir, "investigation_*.json"))):
+        sizes["results_file_bytes"] += os.path.getsize(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            investigations.extend(json.load(f).get("investigations", []))
+    load_seconds = time.perf_counter() - start
+    for path in glob.glob(os.path.join(results_dir, "blobs", "*", "*.gz")):
+        sizes["blob_bytes"] += os.path.getsize(path)
+    return investigations, sizes, load_seconds
+
+def summarize_run(mode, size, workers, wall, peak_rss, investigations, sizes, load_seconds):
+    """Build the report entry for one benchmark run"""
+    statuses = {}
+    for investigation in investigations:
+        status = investigation.get("status", "unknown")
+        statuses[status] = statuses.get(status, 0) + 1
+    durations = [i["duration_seconds"] for i in investigations if "duration_seconds" in i]
+    profiles = {}
+    for investigation in investigations:
+        if "credential_profile" in investigation:
+            name = investigation["credential_profile"]
+            profiles[name] = profiles.get(name, 0) + 1
+    return {
+        "mode": mode,
+        "emails": size,
+        "workers": workers,
+        "wall_seconds": round(wall, 3),
+        "emails_per_second": round(size / wall, 3) if wall else None,
+        "latency": latency_stats(durations),
+        "peak_rss_kib": peak_rss,
+        "results_file_bytes": sizes["results_file_bytes"],
+        "blob_bytes": sizes["blob_bytes"],
+        "results_load_ms": round(load_seconds * 1000, 2),
+        "statuses": statuses,
+        "credential_profiles": profiles,
+    }
+
+def bench_single(count, options, env, scratch):
+    """Investigate count emails with one `-e` process each"""
+    wall = 0.0
+    peak_rss = 0
+    investigations = []
+    sizes = {"results_file_bytes": 0, "blob_bytes": 0}
+    load_seconds = 0.0
+    for index in range(count):
+        # Results files are named by the second, so every run gets its own folder
+        workdir = tempfile.mkdtemp(dir=scratch)
+        elapsed, rss = run_goosint(options + ['-e', f"single{index}@gmail.com"], workdir, env)
+        wall += elapsed
+        peak_rss = max(peak_rss, rss)
+        found, run_sizes, run_load = collect_results(os.path.join(workdir, "results"))
+        investigations.extend(found)
+        for key, value in run_sizes.items():
+            sizes[key] += value
+        load_seconds += run_load
+    return summarize_run("single", count, 1, wall, peak_rss, investigations, sizes, load_seconds)
+
+def bench_batch(size, workers, options, env, scratch):
+    """Investigate a list of size emails with one `-f` process"""
+    workdir = tempfile.mkdtemp(dir=scratch)
+    email_file = os.path.join(workdir, "emails.txt")
+    with open(email_file, 'w') as f:
+        for index in range(size):
+            f.write(f"target{index}@gmail.com\n")
+    wall, peak_rss = run_goosint(options + ['-f', email_file, '-w', str(workers)], workdir, env)
+    investigations, sizes, load_seconds = collect_results(os.path.join(workdir, "results"))
+    return summarize_run("batch", size, workers, wall, peak_rss, investigations, sizes, load_seconds)
+
+# GoOsint options for each console output format
+OUTPUT_FORMATS = {
+    "text": [],
+    "quiet": ['--quiet'],
+    "jsonl": ['--output-format', 'jsonl'],
+}
+
+def git_revision():
+    """Short commit hash of the benchmarked tree, if it is a git checkout"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GoOsint against a fake ghunt command")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 50, 200],
+                       help='Email list sizes for batch mode (default: 10 50 200)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4],
+                       help='Worker counts for batch mode (default: 1 4)')
+    parser.add_argument('--formats', nargs='+', choices=sorted(OUTPUT_FORMATS), default=['text'],
+                       help='Console output formats to compare in batch mode (default: text)')
+    parser.add_argument('--raw', nargs='+', choices=['inline', 'blob', 'none'], default=['inline'],
+                       help='Raw output storage modes to compare in batch mode (default: inline)')
+    parser.add_argument('--single', type=int, default=5, metavar='N',
+                       help='Emails investigated one process at a time in single mode (default: 5, 0 to skip)')
+    parser.add_argument('--latency', type=float, default=0.1,
+                       help='Fake GHunt seconds per email (default: 0.1)')
+    parser.add_argument('--jitter', type=float, default=0.05,
+                       help='Random +/- seconds added to the latency (default: 0.05)')
+    parser.add_argument('--failure-rate', type=float, default=0.02,
+                       help='Share of emails that fail with an error (default: 0.02)')
+    parser.add_argument('--not-found-rate', type=float, default=0.1,
+                       help='Share of emails without a Google account (default: 0.1)')
+    parser.add_argument('--timeout-rate', type=float, default=0.0,
+                       help='Share of emails whose GHunt run hangs (default: 0)')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0,
+                       help='Share of GHunt calls answered with HTTP 429 (default: 0)')
+    parser.add_argument('--timeout', type=float, default=5,
+                       help='GoOsint --timeout for hanging runs, in seconds (default: 5)')
+    parser.add_argument('--profiles', type=int, default=0, metavar='N',
+                       help='Spread GHunt runs over N fake credential profiles (default: 0, no --creds)')
+    parser.add_argument('--throttled-profiles', type=int, default=0, metavar='K',
+                       help='Of those, the first K always get HTTP 429 (default: 0)')
+    parser.add_argument('--seed', default="0",
+                       help='Seed for the fake per-email outcomes (default: 0)')
+    parser.add_argument('-o', '--output',
+                       help='Write the report as JSON to this file')
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp(prefix="goosint-bench-")
+    try:
+        env = dict(os.environ)
+        env["PATH"] = install_fake_ghunt(scratch) + os.pathsep + env.get("PATH", "")
+        env.update({
+            "FAKE_GHUNT_LATENCY": str(args.latency),
+            "FAKE_GHUNT_JITTER": str(args.jitter),
+            "FAKE_GHUNT_FAILURE_RATE": str(args.failure_rate),
+            "FAKE_GHUNT_NOT_FOUND_RATE": str(args.not_found_rate),
+            "FAKE_GHUNT_TIMEOUT_RATE": str(args.timeout_rate),
+            "FAKE_GHUNT_RATE_LIMIT_RATE": str(args.rate_limit_rate),
+            "FAKE_GHUNT_HANG": str(args.timeout * 4 + 10),
+            "FAKE_GHUNT_SEED": str(args.seed),
+        })
+        options = ['--timeout', str(args.timeout)]
+        if args.profiles > 0:
+            options += ['--creds', install_fake_profiles(scratch, args.profiles)]
+            env["FAKE_GHUNT_REQUIRE_SESSION"] = "1"
+            env["FAKE_GHUNT_THROTTLED_PROFILES"] = ",".join(
+                f"profile{index}" for index in range(1, min(args.throttled_profiles, args.profiles) + 1))
+
+        runs = []
+        if args.single > 0:
+            runs.append(bench_single(args.single, options, env, scratch))
+            print(f"single  x{args.single}: {runs[-1]['emails_per_second']} emails/s", file=sys.stderr)
+        for output_format in args.formats:
+            for raw in args.raw:
+                for workers in args.workers:
+                    for size in args.sizes:
+                        run_options = options + OUTPUT_FORMATS[output_format] + ['--raw', raw]
+                        run = bench_batch(size, workers, run_options, env, scratch)
+                        run["output_format"] = output_format
+                        run["raw"] = raw
+                        runs.append(run)
+                        print(f"batch   {size} emails, {workers} worker(s), {output_format}, raw {raw}: "
+                              f"{run['emails_per_second']} emails/s", file=sys.stderr)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    report = {
+        "benchmark": "bench_batch",
+        "date": datetime.now().isoformat(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fake_ghunt": {
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "failure_rate": args.failure_rate,
+            "not_found_rate": args.not_found_rate,
+            "timeout_rate": args.timeout_rate,
+            "rate_limit_rate": args.rate_limit_rate,
+            "seed": args.seed,
+        },
+        "timeout": args.timeout,
+        "profiles": args.profiles,
+        "throttled_profiles": min(args.throttled_profiles, args.profiles),
+        "runs": runs,
+    }
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
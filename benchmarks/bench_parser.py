@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for GoOsint's GHunt output parsing and rendering
+
+Builds large synthetic GHunt outputs by repeating a realistic investigation
+and measures the throughput of line classification, parsing, rendering and
+the combined single-pass pipeline used while streaming GHunt's stdout,
+with and without rendering (--quiet / --output-format jsonl skip it).
+
+Usage:
+  python3 benchmarks/bench_parser.py
+  python3 benchmarks/bench_parser.py --lines 200000 -o parser_bench.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from GoOsint import GoOsint, GHuntOutputParser, classify_ghunt_line
+
+SAMPLE_OUTPUT = """[+] Target found !
+
+🙋 Google Account data
+
+[+] Custom profile picture !
+=> https://lh3.googleusercontent.com/a-/profile
+
+[+] Custom cover picture !
+=> https://lh3.googleusercontent.com/cover
+
+Last profile edit : 2025/06/21 20:24:02 (UTC)
+
+Email : target@gmail.com
+Gaia ID : 118416446611115164332
+
+User types :
+- GOOGLE_USER (The user is a Google user.)
+
+📞 Google Chat Extended Data
+
+Entity Type : PERSON
+Customer ID : Not found.
+
+🌐 Google Plus Extended Data
+
+Entreprise User : False
+
+[+] Activated Google services :
+- Youtube
+- Photos
+- Maps
+
+🎮 Play Games data
+
+[-] No player profile found.
+
+🗺️ Maps data
+
+Profile page : https://www.google.com/maps/contrib/118416446611115164332/reviews
+
+[Statistics]
+Reviews : 7
+Ratings : 3
+Photos : 12
+Answers : 2
+
+🗓️ Calendar data
+
+[-] No public Google Calendar."""
+
+def synthetic_output(total_lines):
+    """Repeat the sample investigation until it has total_lines lines.
+
+    Every repetition gets its own email, Gaia ID and URLs, like the output
+    of a batch over different targets.
+    """
+    lines = []
+    target = 0
+    while len(lines) < total_lines:
+        target += 1
+        investigation = (SAMPLE_OUTPUT
+                         .replace("target@gmail.com", f"target{target}@gmail.com")
+                         .replace("118416446611115164332", str(118416446611115164332 + target))
+                         .replace("/a-/profile", f"/a-/profile{target}"))
+        lines.extend(investigation.split("\n"))
+    return lines[:total_lines]
+
+def measure(name, func, lines, runs):
+    """Best-of-runs wall time for func(lines), reported as lines/sec and MB/sec"""
+    size_mb = sum(len(line.encode("utf-8")) + 1 for line in lines) / 1e6
+    best = float("inf")
+    for _ in range(runs):
+        classify_ghunt_line.cache_clear()
+        start = time.perf_counter()
+        func(lines)
+        best = min(best, time.perf_counter() - start)
+    return {
+        "stage": name,
+        "seconds": round(best, 4),
+        "lines_per_sec": round(len(lines) / best),
+        "mb_per_sec": round(size_mb / best, 2),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GHunt output parsing")
+    parser.add_argument('-l', '--lines', type=int, default=100000,
+                       help='Number of synthetic output lines (default: 100000)')
+    parser.add_argument('-n', '--runs', type=int, default=5,
+                       help='Repetitions per stage, best time is kept (default: 5)')
+    parser.add_argument('-o', '--output',
+                       help='Write the results as JSON to this file')
+    args = parser.parse_args()
+
+    goosint = GoOsint.__new__(GoOsint)  # renderer/parser only, no results folder
+    lines = synthetic_output(args.lines)
+
+    def classify(lines):
+        for line in lines:
+            classify_ghunt_line(line)
+
+    def parse(lines):
+        goosint.parse_ghunt_output(lines, "target@gmail.com")
+
+    def render(lines):
+        goosint.render_ghunt_output(lines)
+
+    def pipeline(lines):
+        out = []
+        ghunt_parser = GHuntOutputParser("target@gmail.com")
+        for line in lines:
+            info = classify_ghunt_line(line)
+            out.extend(goosint.render_ghunt_line(line, info))
+            ghunt_parser.feed(line, info)
+
+    def quiet_pipeline(lines):
+        ghunt_parser = GHuntOutputParser("target@gmail.com")
+        for line in lines:
+            ghunt_parser.feed(line, classify_ghunt_line(line))
+
+    report = {
+        "lines": len(lines),
+        "runs": args.runs,
+        "results": [measure(name, func, lines, args.runs) for name, func in
+                    (("classify", classify), ("parse", parse), ("render", render), ("pipeline", pipeline),
+                     ("quiet", quiet_pipeline))],
+    }
+    seconds = {result["stage"]: result["seconds"] for result in report["results"]}
+    # Share of the streaming pipeline that quiet mode no longer spends on rendering
+    report["render_overhead_pct"] = round((1 - seconds["quiet"] / seconds["pipeline"]) * 100, 1)
+
+    for result in report["results"]:
+        print(f"{result['stage']:<10} {result['lines_per_sec']:>12,} lines/s "
+              f"{result['mb_per_sec']:>8} MB/s  ({result['seconds']}s)")
+    print(f"rendering is {report['render_overhead_pct']}% of the pipeline, skipped in quiet mode")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Stand-in for the `ghunt` command used by the GoOsint benchmarks
+
+Answers `ghunt email <address>` with recorded GHunt output, without any
+network access or Google session. Its behaviour is configured through
+environment variables so it can be put on PATH unchanged:
+
+  FAKE_GHUNT_LATENCY           seconds per investigation (default: 0.1)
+  FAKE_GHUNT_JITTER            +/- seconds added to the latency (default: 0)
+  FAKE_GHUNT_FAILURE_RATE      share of emails that fail with an error (default: 0)
+  FAKE_GHUNT_NOT_FOUND_RATE    share of emails without a Google account (default: 0)
+  FAKE_GHUNT_TIMEOUT_RATE      share of emails that hang after partial output (default: 0)
+  FAKE_GHUNT_RATE_LIMIT_RATE   share of calls answered with HTTP 429 (default: 0)
+  FAKE_GHUNT_HANG              seconds a hanging run sleeps (default: 3600)
+  FAKE_GHUNT_SEED              seed for the per-email outcomes (default: 0)
+  FAKE_GHUNT_REQUIRE_SESSION   1 to fail like GHunt when there is no credentials file
+  FAKE_GHUNT_THROTTLED_PROFILES  comma-separated profiles always answered with HTTP 429
+  FAKE_GHUNT_INVALID_PROFILES    comma-separated profiles whose session is rejected
+
+Failures, missing accounts, hangs and jitter are derived from the seed and
+the email, so every run over the same list behaves the same. Rate limiting
+is drawn afresh on every call, so retried emails eventually get through.
+
+Like GHunt, the credentials are looked up in ~/.malfrats/ghunt/creds.m. The
+profile is the name of that file without its extension, following links,
+so the credential profiles GoOsint links there (--creds) can be told apart.
+"""
+
+import hashlib
+import os
+import random
+import sys
+import time
+
+BANNER = """
+        .d8888b.  888    888                   888
+       d88P  Y88b 888    888                   888
+       888    888 888    888                   888
+       888        8888888888 888  888 88888b.  888888
+       888  88888 888    888 888  888 888 "88b 888
+       888    888 888    888 888  888 888  888 888
+       Y88b  d88P 888    888 Y88b 888 888  888 Y88b.
+        "Y8888P88 888    888  "Y88888 888  888  "Y888
+
+     By: mxrch (🐦 @mxrchreborn)
+     Support my work on GitHub Sponsors ! 💖
+
+
+> GHunt 2.3.4 (Bullet Sparrow) <
+
+🥳 GHunt is up to date !
+"""
+
+SECTIONS = [
+    """[+] Stored session loaded !
+[+] Authenticated !
+
+[+] Target found !
+""",
+    """🙋 Google Account data
+
+[+] Custom profile picture !
+=> https://lh3.googleusercontent.com/a-/{gaia}
+
+[-] Default cover picture
+
+Last profile edit : 2025/06/21 20:24:02 (UTC)
+
+Email : {email}
+Gaia ID : {gaia}
+
+User types :
+- GOOGLE_USER (The user is a Google user.)
+""",
+    """📞 Google Chat Extended Data
+
+Entity Type : PERSON
+Customer ID : Not found.
+""",
+    """🌐 Google Plus Extended Data
+
+Entreprise User : False
+
+[+] Activated Google services :
+- Youtube
+- Photos
+- Maps
+""",
+    """🎮 Play Games data
+
+[-] No player profile found.
+""",
+    """🗺️ Maps data
+
+Profile page : https://www.google.com/maps/contrib/{gaia}/reviews
+
+[Statistics]
+Reviews : {reviews}
+Ratings : 3
+Photos : 12
+Answers : 2
+""",
+    """🗓️ Calendar data
+
+[-] No public Google Calendar.
+""",
+]
+
+NOT_FOUND = """[+] Stored session loaded !
+[+] Authenticated !
+
+[-] The target wasn't found.
+"""
+
+FAILURE = """Traceback (most recent call last):
+  File "ghunt/modules/email.py", line 31, in hunt
+httpx.ConnectError: [Errno 104] Connection reset by peer"""
+
+RATE_LIMIT = "[-] Google responded with HTTP 429 Too Many Requests, try again later."
+
+INVALID_SESSION = """Traceback (most recent call last):
+  File "ghunt/helpers/auth.py", line 210, in load_and_auth
+ghunt.errors.GHuntInvalidSession: Please generate a new session by doing => ghunt login"""
+
+def setting(name, default):
+    """Read a numeric FAKE_GHUNT_* environment variable"""
+    try:
+        return float(os.environ.get(f"FAKE_GHUNT_{name}", default))
+    except ValueError:
+        return float(default)
+
+def profile_list(name):
+    """Read a comma-separated FAKE_GHUNT_* list of profile names"""
+    return {item.strip() for item in os.environ.get(f"FAKE_GHUNT_{name}", "").split(",") if item.strip()}
+
+def current_profile():
+    """Name of the credentials file GHunt would load, or None without one"""
+    path = os.path.join(os.path.expanduser("~"), ".malfrats", "ghunt", "creds.m")
+    if not os.path.isfile(path):
+        return None
+    return os.path.splitext(os.path.basename(os.path.realpath(path)))[0]
+
+def emit(text):
+    """Print text and push it to the reader straight away, like GHunt does"""
+    sys.stdout.write(text + "\n")
+    sys.stdout.flush()
+
+def investigate(email):
+    """Replay one investigation and return the exit code"""
+    seed = os.environ.get("FAKE_GHUNT_SEED", "0")
+    digest = hashlib.blake2b(f"{seed}:{email}".encode("utf-8"), digest_size=8).digest()
+    rng = random.Random(digest)
+    roll = rng.random()
+    jitter = setting("JITTER", 0)
+    latency = max(0.0, setting("LATENCY", 0.1) + rng.uniform(-jitter, jitter))
+    gaia = str(100000000000000000000 + int.from_bytes(digest, "big") % 10**20)
+
+    failure_rate = setting("FAILURE_RATE", 0)
+    not_found_rate = setting("NOT_FOUND_RATE", 0)
+    timeout_rate = setting("TIMEOUT_RATE", 0)
+
+    emit(BANNER)
+    profile = current_profile()
+    if (profile is None and setting("REQUIRE_SESSION", 0)) or profile in profile_list("INVALID_PROFILES"):
+        time.sleep(latency / 4)
+        print(INVALID_SESSION, file=sys.stderr)
+        return 1
+    if profile in profile_list("THROTTLED_PROFILES") or random.random() < setting("RATE_LIMIT_RATE", 0):
+        time.sleep(latency / 4)
+        print(RATE_LIMIT, file=sys.stderr)
+        return 1
+    if roll < failure_rate:
+        time.sleep(latency / 2)
+        print(FAILURE, file=sys.stderr)
+        return 1
+    roll -= failure_rate
+    if roll < not_found_rate:
+        time.sleep(latency)
+        emit(NOT_FOUND)
+        return 0
+    roll -= not_found_rate
+    hang = roll < timeout_rate
+
+    # Spread the latency over the sections, as GHunt queries one API per section
+    pause = latency / len(SECTIONS)
+    for index, section in enumerate(SECTIONS):
+        time.sleep(pause)
+        emit(section.format(email=email, gaia=gaia, reviews=rng.randint(0, 50)))
+        if hang and index == 1:
+            time.sleep(setting("HANG", 3600))
+            return 1
+    return 0
+
+def main():
+    if len(sys.argv) >= 3 and sys.argv[1] == "email":
+        sys.exit(investigate(sys.argv[2]))
+    print("usage: ghunt email <email_address>")
+    sys.exit(0 if "--help" in sys.argv or "-h" in sys.argv else 2)
+
+if __name__ == "__main__":
+    main()
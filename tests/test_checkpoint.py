@@ -0,0 +1,58 @@
+"""Interrupted batches must not checkpoint emails whose records were never saved"""
+
+import glob
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from GoOsint import GoOsint, iter_stream_records
+
+EMAILS = [f"target{index}@example.org" for index in range(1, 21)]
+
+def make_goosint(results_name, interrupt_after=None):
+    """A GoOsint whose investigations succeed instantly, raising Ctrl-C after interrupt_after emails"""
+    goosint = GoOsint()
+    goosint.results_file = os.path.join(goosint.results_folder, results_name)
+    goosint.enable_quiet()
+    investigated = []
+
+    def investigate_email(email):
+        if interrupt_after is not None and len(investigated) == interrupt_after:
+            raise KeyboardInterrupt
+        investigated.append(email)
+        return {"email": email, "timestamp": datetime.now().isoformat(), "status": "success",
+                "profile": {}, "services": {}, "raw_output": []}, ""
+
+    goosint.investigate_email = investigate_email
+    return goosint
+
+def saved_emails():
+    """Emails of every investigation saved in the results folder"""
+    emails = []
+    for path in glob.glob(os.path.join("results", "*.jsonl")):
+        emails += [record["email"] for _, record in iter_stream_records(path) if record is not None]
+    return emails
+
+def test_interrupted_batch_resumes_without_losing_records(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    email_list = tmp_path / "emails.txt"
+    email_list.write_text("\n".join(EMAILS) + "\n")
+
+    first = make_goosint("first.json", interrupt_after=8)
+    with pytest.raises(KeyboardInterrupt):
+        first.batch_investigation(str(email_list))
+    first.close()
+    assert sorted(saved_emails()) == sorted(EMAILS[:8])
+
+    second = make_goosint("second.json")
+    second.batch_investigation(str(email_list), resume_from=os.path.join("results", "first.json"))
+    second.close()
+
+    assert sorted(saved_emails()) == sorted(EMAILS)
+    with open(os.path.join("results", "second.json"), encoding="utf-8") as f:
+        assert [record["email"] for record in json.load(f)["investigations"]] == EMAILS[8:]
@@ -0,0 +1,106 @@
+"""GHuntLibraryEngine against fake GHunt helpers (no GHunt install or session needed)"""
+
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from GoOsint import GHuntLibraryEngine, GoOsint
+
+STATS = {"Reviews": 12, "Ratings": 0, "Photos": 3}
+
+def make_target():
+    container = "PROFILE"
+    return SimpleNamespace(
+        sourceIds={container: SimpleNamespace(lastUpdated=None)},
+        profilePhotos={container: SimpleNamespace(isDefault=True, url="")},
+        emails={container: SimpleNamespace(value="target@gmail.com")},
+        personId="123456789012345678901",
+        profileInfos={},
+        extendedData=SimpleNamespace(
+            dynamiteData=SimpleNamespace(entityType="PERSON", customerId=None),
+            gplusData=SimpleNamespace(isEntrepriseUser=False),
+        ),
+        inAppReachability={},
+    )
+
+def make_engine(reviews_result):
+    """An engine whose GHunt helpers are stubs; get_reviews returns reviews_result"""
+
+    async def people_lookup(client, email, params_template=None):
+        return True, make_target()
+
+    async def search_player(creds, client, email):
+        return []
+
+    async def get_reviews(client, gaia_id):
+        return reviews_result
+
+    async def fetch_all(creds, client, email):
+        return False, None, None
+
+    engine = object.__new__(GHuntLibraryEngine)
+    engine.creds = None
+    engine._client = None
+    engine._people_pa = SimpleNamespace(people_lookup=people_lookup)
+    engine._playgames = SimpleNamespace(search_player=search_player)
+    engine._gmaps = SimpleNamespace(get_reviews=get_reviews)
+    engine._calendar = SimpleNamespace(fetch_all=fetch_all)
+    return engine
+
+@pytest.mark.parametrize("reviews_result", [
+    ("", STATS, [], []),  # GHunt 2.0.0 - 2.3.3
+    ("", STATS),          # GHunt 2.3.4
+], ids=["four-values", "two-values"])
+def test_lookup_accepts_both_get_reviews_shapes(reviews_result):
+    found, profile, services, lines = asyncio.run(make_engine(reviews_result)._lookup("target@gmail.com"))
+
+    assert found
+    assert profile["gaia_id"] == "123456789012345678901"
+    assert services["maps_reviews"] == "12"
+    assert services["maps_photos"] == "3"
+    assert "Reviews : 12" in lines
+
+class BrokenEngine:
+    """Engine whose lookups fail with error"""
+
+    def __init__(self, error):
+        self.error = error
+        self.closed = False
+
+    def lookup(self, email, timeout=60):
+        raise self.error
+
+    def close(self):
+        self.closed = True
+
+def make_goosint(engine):
+    goosint = GoOsint()
+    goosint.enable_quiet()
+    goosint.engine = engine
+    goosint._run_ghunt_subprocess = lambda email, out, profile=None: {
+        "email": email, "status": "success", "timings": {}}
+    return goosint
+
+def test_engine_api_error_falls_back_to_subprocess():
+    engine = BrokenEngine(AttributeError("'PeoplePaHttp' object has no attribute 'people_lookup'"))
+    goosint = make_goosint(engine)
+
+    investigation_data, _ = goosint.investigate_email("target@gmail.com")
+
+    assert investigation_data["status"] == "success"
+    assert goosint.engine is None
+    goosint.close()
+    assert engine.closed
+
+def test_engine_network_error_is_recorded():
+    goosint = make_goosint(BrokenEngine(ConnectionResetError("Connection reset by peer")))
+
+    investigation_data, _ = goosint.investigate_email("target@gmail.com")
+
+    assert investigation_data["status"] == "error"
+    assert goosint.engine is not None
@@ -0,0 +1,97 @@
+"""GHunt output parsing must extract the same fields as the original substring parser"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+sys.path.insert(0, ROOT)
+
+from GoOsint import GoOsint, is_ghunt_content_line
+
+FAKE_GHUNT = os.path.join(ROOT, "benchmarks", "fake_ghunt.py")
+TRANSCRIPT = os.path.join(ROOT, "tests", "data", "ghunt_email_transcript.txt")
+
+def baseline_parse(output_lines):
+    """The parser GoOsint used before the table-driven line classifier (profile and services only)"""
+    data = {"services": {}, "profile": {}}
+    current_section = None
+    for line in output_lines:
+        line = line.strip()
+        if not line:
+            continue
+        if "🙋 Google Account data" in line:
+            current_section = "google_account"
+        elif "📞 Google Chat Extended Data" in line:
+            current_section = "google_chat"
+        elif "🌐 Google Plus Extended Data" in line:
+            current_section = "google_plus"
+        elif "🎮 Play Games data" in line:
+            current_section = "play_games"
+        elif "🗺️ Maps data" in line:
+            current_section = "maps"
+        elif "🗓️ Calendar data" in line:
+            current_section = "calendar"
+        elif "🎵 YouTube data" in line:
+            current_section = "youtube"
+
+        if "Email :" in line:
+            data["profile"]["email"] = line.split("Email :")[1].strip()
+        elif "Gaia ID :" in line:
+            data["profile"]["gaia_id"] = line.split("Gaia ID :")[1].strip()
+        elif "Last profile edit :" in line:
+            data["profile"]["last_edit"] = line.split("Last profile edit :")[1].strip()
+        elif line.startswith("=> https://"):
+            data["profile"]["profile_picture"] = line.replace("=> ", "")
+        elif "Profile page :" in line:
+            data["services"]["maps_profile"] = line.split("Profile page :")[1].strip()
+        elif "Entity Type :" in line:
+            data["services"]["chat_entity_type"] = line.split("Entity Type :")[1].strip()
+        elif "Customer ID :" in line:
+            data["services"]["chat_customer_id"] = line.split("Customer ID :")[1].strip()
+        elif "Entreprise User :" in line:
+            data["services"]["enterprise_user"] = line.split("Entreprise User :")[1].strip()
+        elif line.startswith("[+]") and "Activated Google services" in line:
+            data["services"]["activated_services"] = []
+        elif line.startswith("- ") and current_section in ["google_plus"]:
+            data["services"].setdefault("activated_services", []).append(line[2:])
+        elif "Reviews :" in line:
+            data["services"]["maps_reviews"] = line.split("Reviews :")[1].strip()
+        elif "Photos :" in line:
+            data["services"]["maps_photos"] = line.split("Photos :")[1].strip()
+        elif "Answers :" in line:
+            data["services"]["maps_answers"] = line.split("Answers :")[1].strip()
+    return data
+
+def strip_banner(lines):
+    """Drop GHunt's banner the way the subprocess backend does"""
+    for index, line in enumerate(lines):
+        if is_ghunt_content_line(line):
+            return lines[index:]
+    return []
+
+def fake_ghunt_output(email):
+    env = dict(os.environ, FAKE_GHUNT_LATENCY="0")
+    result = subprocess.run([sys.executable, FAKE_GHUNT, "email", email],
+                            capture_output=True, text=True, env=env, check=True)
+    return strip_banner(result.stdout.splitlines())
+
+def read_transcript():
+    with open(TRANSCRIPT, encoding="utf-8") as f:
+        return strip_banner(f.read().splitlines())
+
+@pytest.mark.parametrize("read_lines", [
+    pytest.param(lambda: fake_ghunt_output("target.one@gmail.com"), id="fake-ghunt"),
+    pytest.param(lambda: fake_ghunt_output("someone.else@example.org"), id="fake-ghunt-other-domain"),
+    pytest.param(read_transcript, id="ghunt-transcript"),
+])
+def test_parser_matches_baseline(read_lines):
+    lines = read_lines()
+    expected = baseline_parse(lines)
+    data = GoOsint().parse_ghunt_output(lines, "target@gmail.com")
+
+    assert expected["profile"] and expected["services"]
+    assert data["profile"] == expected["profile"]
+    assert data["services"] == expected["services"]